@@ -8,6 +8,7 @@ Endpoints:
     POST /scan        — Scan code/text for AI framework usage + compliance check
 
 Rate limiting: 10 requests/day (IP-based) without API key; unlimited with valid key.
+Set REDIS_URL to share the counter across uvicorn workers (requires redis-py).
 API key: pass via X-Api-Key header or Authorization: Bearer <key>.
 """
 
@@ -22,6 +23,8 @@ import urllib.parse
 import urllib.request
 import logging
 import os
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
@@ -53,7 +56,7 @@ def _load_stripe_config() -> dict:
 
 _STRIPE = _load_stripe_config()
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
 # Add parent dir to path so we can import server.py
@@ -61,7 +64,10 @@ _parent = str(Path(__file__).resolve().parent.parent)
 if _parent not in sys.path:
     sys.path.insert(0, _parent)
 
-from server import EUAIActChecker, RISK_CATEGORIES, ACTIONABLE_GUIDANCE, _api_key_manager
+from server import (
+    EUAIActChecker, RISK_CATEGORIES, ACTIONABLE_GUIDANCE, AI_MODEL_PATTERNS,
+    CONFIG_DEPENDENCY_PATTERNS, _api_key_manager,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -119,23 +125,94 @@ def _get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
+_rate_limit_lock = threading.Lock()
+# ip -> epoch of the next UTC midnight, for IPs that already exhausted today's quota.
+# Lets repeat offenders be rejected without touching Redis or the rate-limit file.
+_BLOCKED: dict[str, float] = {}
+_redis = None  # lazily-connected client when REDIS_URL is set; False once unavailable
+
+
+def _get_redis():
+    """Return a Redis client when REDIS_URL is configured and redis-py is installed."""
+    global _redis
+    if _redis is None:
+        url = os.environ.get("REDIS_URL")
+        if not url:
+            _redis = False
+        else:
+            try:
+                import redis
+                _redis = redis.Redis.from_url(url, socket_timeout=1)
+            except ImportError:
+                logger.warning("REDIS_URL is set but redis is not installed; using file rate limits")
+                _redis = False
+    return _redis or None
+
+
+def _seconds_until_midnight(now_dt: datetime) -> int:
+    midnight = (now_dt + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return int((midnight - now_dt).total_seconds())
+
+
 def _check_rate_limit(ip: str) -> tuple[bool, int]:
-    """Returns (allowed, remaining). Increments counter if allowed."""
-    limits = _load_json(_RATE_LIMITS_FILE, {})
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    # Purge stale dates
-    limits = {k: v for k, v in limits.items() if v.get("date") == today}
-    entry = limits.get(ip, {"date": today, "count": 0})
-    if entry.get("date") != today:
-        entry = {"date": today, "count": 0}
-    remaining = max(0, _FREE_TIER_LIMIT - entry["count"])
-    if remaining > 0:
-        entry["count"] += 1
-        entry["date"] = today
-        limits[ip] = entry
-        _save_json(_RATE_LIMITS_FILE, limits)
-        return True, remaining - 1
-    return False, 0
+    """Returns (allowed, remaining). Increments counter if allowed.
+
+    With REDIS_URL set the counter is an atomic INCR shared by all workers;
+    otherwise it lives in _RATE_LIMITS_FILE (correct for a single worker only).
+    IPs that hit the limit are remembered in _BLOCKED until midnight.
+    """
+    now = time.time()
+    # /scan runs in the threadpool: _BLOCKED is only touched under the lock.
+    # The store call itself happens outside it (the file path takes the lock).
+    with _rate_limit_lock:
+        blocked_until = _BLOCKED.get(ip)
+    if blocked_until is not None and now < blocked_until:
+        return False, 0
+
+    now_dt = datetime.fromtimestamp(now, timezone.utc)
+    allowed, remaining = _check_rate_limit_store(ip, now_dt)
+    if not allowed:
+        with _rate_limit_lock:
+            expired = [k for k, until in _BLOCKED.items() if until <= now]
+            for k in expired:
+                del _BLOCKED[k]
+            _BLOCKED[ip] = now + _seconds_until_midnight(now_dt)
+    return allowed, remaining
+
+
+def _check_rate_limit_store(ip: str, now_dt: datetime) -> tuple[bool, int]:
+    """Increment the persisted counter for ``ip`` (Redis or file)."""
+    today = now_dt.strftime("%Y-%m-%d")
+
+    client = _get_redis()
+    if client is not None:
+        key = f"wrapper_rl:{today}:{ip}"
+        try:
+            pipe = client.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, _seconds_until_midnight(now_dt) + 60)
+            count = pipe.execute()[0]
+            if count > _FREE_TIER_LIMIT:
+                return False, 0
+            return True, _FREE_TIER_LIMIT - count
+        except Exception as e:
+            logger.warning("Redis rate limit unavailable, falling back to file: %s", e)
+
+    with _rate_limit_lock:
+        limits = _load_json(_RATE_LIMITS_FILE, {})
+        # Purge stale dates
+        limits = {k: v for k, v in limits.items() if v.get("date") == today}
+        entry = limits.get(ip, {"date": today, "count": 0})
+        if entry.get("date") != today:
+            entry = {"date": today, "count": 0}
+        remaining = max(0, _FREE_TIER_LIMIT - entry["count"])
+        if remaining > 0:
+            entry["count"] += 1
+            entry["date"] = today
+            limits[ip] = entry
+            _save_json(_RATE_LIMITS_FILE, limits)
+            return True, remaining - 1
+        return False, 0
 
 
 app = FastAPI(
@@ -202,7 +279,7 @@ def categories():
     for cat, info in RISK_CATEGORIES.items():
         result[cat] = {
             "description": info["description"],
-            "requirements": info["requirements"],
+            "requirements": list(info["requirements"]),
             "requirements_count": len(info["requirements"]),
         }
     return {
@@ -211,41 +288,83 @@ def categories():
     }
 
 
-@app.post("/scan", response_model=ScanResponse)
-def scan(req: ScanRequest, request: Request):
-    """Scan submitted text/code for AI framework usage and check EU AI Act compliance.
+# Changes whenever the scanner's rules change, so cached /scan results go stale with them
+_SCANNER_FINGERPRINT = hashlib.sha256(json.dumps(
+    [AI_MODEL_PATTERNS, CONFIG_DEPENDENCY_PATTERNS, RISK_CATEGORIES, ACTIONABLE_GUIDANCE],
+    sort_keys=True, default=str,
+).encode()).hexdigest()
 
-    The text is written to a temporary directory, scanned by the EU AI Act checker,
-    and then cleaned up. No data is persisted.
 
-    Rate limit: 10 requests/day per IP (free). Pass X-Api-Key or Authorization: Bearer
-    for unlimited access.
+def _scan_etag(req: ScanRequest) -> str:
+    """Dependency: strong ETag for a /scan body (the response is a pure function of it)."""
+    body = json.dumps(req.model_dump(), sort_keys=True)
+    digest = hashlib.sha256(f"{_SCANNER_FINGERPRINT}:{body}".encode()).hexdigest()[:16]
+    return f'"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _enforce_free_tier(request: Request, etag: str = Depends(_scan_etag)) -> None:
+    """Dependency: 429 unless the caller has a paid API key or free-tier quota left.
+
+    Revalidations that will be answered 304 do not consume quota.
     """
-    # --- Rate limiting ---
+    if _etag_matches(request, etag):
+        return
     api_key = _extract_api_key(request)
-    if not _validate_api_key(api_key):
-        ip = _get_client_ip(request)
-        allowed, remaining = _check_rate_limit(ip)
-        if not allowed:
-            now_dt = datetime.now(timezone.utc)
-            midnight = (now_dt + timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            raise HTTPException(
-                status_code=429,
-                detail={
-                    "error": f"Rate limit exceeded ({_FREE_TIER_LIMIT}/day)",
-                    "upgrade": "Pass X-Api-Key header for unlimited access",
-                    "resets_in_seconds": int((midnight - now_dt).total_seconds()),
-                },
-            )
+    if _validate_api_key(api_key):
+        return
+    allowed, _ = _check_rate_limit(_get_client_ip(request))
+    if not allowed:
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": f"Rate limit exceeded ({_FREE_TIER_LIMIT}/day)",
+                "upgrade": "Pass X-Api-Key header for unlimited access",
+                "resets_in_seconds": _seconds_until_midnight(datetime.now(timezone.utc)),
+            },
+        )
 
+
+def _validated_scan_request(req: ScanRequest, _: None = Depends(_enforce_free_tier)) -> ScanRequest:
+    """Dependency: rate-limited, parsed and validated /scan body."""
     if req.risk_category not in RISK_CATEGORIES:
         raise HTTPException(
             status_code=422,
             detail=f"Invalid risk_category '{req.risk_category}'. "
                    f"Valid: {list(RISK_CATEGORIES.keys())}",
         )
+    return req
+
+
+@app.post("/scan", response_model=ScanResponse)
+def scan(
+    request: Request,
+    response: Response,
+    req: ScanRequest = Depends(_validated_scan_request),
+    etag: str = Depends(_scan_etag),
+):
+    """Scan submitted text/code for AI framework usage and check EU AI Act compliance.
+
+    The text is written to a temporary directory, scanned by the EU AI Act checker,
+    and then cleaned up. No data is persisted.
+
+    Rate limit: 10 requests/day per IP (free). Pass X-Api-Key or Authorization: Bearer
+    for unlimited access.
+
+    Responses carry an ETag; resending the same body with If-None-Match returns
+    304 without scanning and without counting against the rate limit.
+    """
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=60"
 
     # Sanitize filename to prevent path traversal
     safe_name = Path(req.filename).name
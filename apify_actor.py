@@ -19,41 +19,118 @@ ACTIONNAIRE SETUP:
 """
 
 import asyncio
+import http.client
+import re
 import sys
 import json
-import subprocess
+import tarfile
 import tempfile
+import urllib.request
+import zlib
 from pathlib import Path
 
-# Apify SDK 3.3.0 — pay-per-event supported
-from apify import Actor
+# server.py lives next to this file
+_HERE = str(Path(__file__).parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+
+def _scan_checkout(path: str, risk_category: str) -> dict:
+    """Run the (blocking) compliance checker on a local checkout."""
+    try:
+        from server import EUAIActChecker
+        checker = EUAIActChecker(path)
+        scan = checker.scan_project()
+        if "error" in scan:
+            return scan
+        compliance = checker.check_compliance(risk_category)
+        if "error" in compliance:
+            return compliance
+        report = checker.generate_report(scan, compliance)
+        return {
+            "files_scanned": scan.get("files_scanned", 0),
+            "frameworks_detected": list(scan.get("detected_models", {})),
+            "compliance_score": compliance.get("compliance_score", "unknown"),
+            "compliance_percentage": compliance.get("compliance_percentage", 0),
+            "recommendations": report.get("recommendations", []),
+        }
+    except Exception as e:
+        return {"error": f"Scan failed: {str(e)[:200]}"}
+
+
+_GITHUB_URL_RE = re.compile(r"^https?://(?:www\.)?github\.com/([\w.-]+)/([\w.-]+?)(?:\.git)?/?$")
+
+
+def _fetch_github_tarball(repo_url: str, dest: str) -> bool:
+    """Stream the HEAD tarball of a GitHub repo into ``dest``.
+
+    Avoids writing the .git object store that ``git clone`` produces: only the
+    working-tree files the scanner may read are extracted, decompressed straight
+    off the socket. Returns False when the URL is not a GitHub repo or the
+    download fails, so the caller can fall back to git clone.
+    """
+    m = _GITHUB_URL_RE.match(repo_url)
+    if not m:
+        return False
+    from server import SKIP_DIRS, MAX_FILE_SIZE_BYTES
+
+    url = f"https://codeload.github.com/{m.group(1)}/{m.group(2)}/tar.gz/HEAD"
+    root = Path(dest)
+    try:
+        with urllib.request.urlopen(url, timeout=30) as resp, \
+                tarfile.open(fileobj=resp, mode="r|gz") as tar:
+            for member in tar:
+                if not member.isreg() or member.size > MAX_FILE_SIZE_BYTES:
+                    continue
+                # Drop the "<repo>-<sha>/" prefix GitHub adds
+                parts = member.name.split("/")[1:]
+                if not parts or ".." in parts or SKIP_DIRS.intersection(parts[:-1]):
+                    continue
+                target = root.joinpath(*parts)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(tar.extractfile(member).read())
+    except (OSError, tarfile.TarError, http.client.HTTPException, EOFError, zlib.error):
+        # Includes a connection dropped mid-stream (IncompleteRead) and a
+        # truncated gzip body; git clone gets the next try.
+        return False
+    return True
 
 
 async def run_compliance_scan(repo_url: str, risk_category: str = "limited") -> dict:
-    """Run the EU AI Act compliance scanner on a GitHub repo."""
-    # Clone repo to temp dir
+    """Run the EU AI Act compliance scanner on a GitHub repo.
+
+    GitHub repos are fetched as a streamed tarball; other hosts fall back to
+    ``git clone --depth=1``. The clone runs as an async subprocess and the scan
+    in a worker thread, so the event loop stays free for Actor I/O.
+    """
     with tempfile.TemporaryDirectory() as tmpdir:
-        result = subprocess.run(
-            ["git", "clone", "--depth=1", repo_url, tmpdir],
-            capture_output=True,
-            text=True,
-            timeout=60
+        if await asyncio.to_thread(_fetch_github_tarball, repo_url, tmpdir):
+            return await asyncio.to_thread(_scan_checkout, tmpdir, risk_category)
+
+        # Non-GitHub host (or tarball unavailable): clone into a fresh subdir
+        checkout = str(Path(tmpdir) / "clone")
+        proc = await asyncio.create_subprocess_exec(
+            "git", "clone", "--depth=1", repo_url, checkout,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        if result.returncode != 0:
-            return {"error": f"Git clone failed: {result.stderr[:200]}"}
-
-        # Import and run the compliance checker
-        sys.path.insert(0, str(Path(__file__).parent))
         try:
-            from server import EUAIActChecker
-            checker = EUAIActChecker(risk_category=risk_category)
-            scan_result = checker.analyze_project(tmpdir)
-            return scan_result
-        except Exception as e:
-            return {"error": f"Scan failed: {str(e)[:200]}"}
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return {"error": "Git clone failed: timed out after 60s"}
+        if proc.returncode != 0:
+            return {"error": f"Git clone failed: {stderr.decode(errors='replace')[:200]}"}
+
+        return await asyncio.to_thread(_scan_checkout, checkout, risk_category)
 
 
 async def main():
+    # Apify SDK 3.3.0 — pay-per-event supported. Imported here so the fetch
+    # and scan helpers above can be used (and tested) without the SDK.
+    from apify import Actor
+
     async with Actor:
         # Get input
         actor_input = await Actor.get_input() or {}
@@ -8,6 +8,7 @@ Architecture: This module provides GDPR-specific data (patterns, checks, templat
 The server.py imports and exposes GDPR tools via MCP.
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Dict, List, Any
@@ -473,22 +474,68 @@ Document ALL breaches (even those not requiring notification):
 # GDPR — Checker Class
 # ============================================================
 
-CODE_EXTENSIONS = {".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".go", ".rs", ".rb", ".php"}
-CONFIG_FILE_NAMES = {
+CODE_EXTENSIONS = frozenset({".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".go", ".rs", ".rb", ".php"})
+CONFIG_FILE_NAMES = frozenset({
     "package.json", "package-lock.json",
     "requirements.txt", "requirements-dev.txt",
     "setup.py", "setup.cfg", "pyproject.toml",
     "Pipfile", "Pipfile.lock",
     "Cargo.toml", "go.mod", "Gemfile",
     "composer.json",
-}
+})
 MAX_FILES = 5000
 MAX_FILE_SIZE = 1_000_000
-SKIP_DIRS = {
+
+# Pattern tables compiled once at import instead of per file via re's cache
+_GDPR_CODE_REGEX = {
+    category: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for category, patterns in GDPR_CODE_PATTERNS.items()
+}
+_GDPR_CONFIG_REGEX = {
+    category: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for category, patterns in GDPR_CONFIG_PATTERNS.items()
+}
+_UNFILLED_PLACEHOLDER_RE = re.compile(r'\[(?:Your |e\.g\.|Date|Duration|Role|Describe|Email)')
+# Directories to skip during scanning (dependencies, build artifacts, VCS).
+# Shared with server.py's EU AI Act scan.
+SKIP_DIRS = frozenset({
     ".venv", "venv", ".env", "env", "node_modules", ".git",
     "__pycache__", ".pytest_cache", ".tox", ".mypy_cache",
     "dist", "build", ".eggs", ".smithery", ".cache",
-}
+})
+
+
+def _file_suffix(name: str) -> str:
+    """Same result as ``Path(name).suffix`` without building a Path."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ""
+
+
+def _iter_project_files(root: Path):
+    """Yield an ``os.DirEntry`` for every regular file under ``root``.
+
+    Iterative os.scandir walk: the directory listing's d_type answers
+    is_dir/is_file without a stat per entry, SKIP_DIRS subtrees are pruned
+    before they are entered, symlinks are not followed, and unreadable
+    directories are skipped.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
 
 
 class GDPRChecker:
@@ -505,22 +552,21 @@ class GDPRChecker:
         if not self.project_path.exists():
             return {"error": f"Path does not exist: {self.project_path}", "detected_patterns": {}}
 
-        for file_path in self.project_path.rglob("*"):
-            if SKIP_DIRS.intersection(file_path.parts):
-                continue
+        for entry in _iter_project_files(self.project_path):
             if self.files_scanned >= MAX_FILES:
                 break
-            if not file_path.is_file():
+            is_code = _file_suffix(entry.name) in CODE_EXTENSIONS
+            if not is_code and entry.name not in CONFIG_FILE_NAMES:
                 continue
             try:
-                if file_path.stat().st_size > MAX_FILE_SIZE:
+                if entry.stat(follow_symlinks=False).st_size > MAX_FILE_SIZE:
                     continue
             except OSError:
                 continue
-            if file_path.suffix in CODE_EXTENSIONS:
-                self._scan_code(file_path)
-            elif file_path.name in CONFIG_FILE_NAMES:
-                self._scan_config(file_path)
+            if is_code:
+                self._scan_code(Path(entry.path))
+            else:
+                self._scan_config(Path(entry.path))
 
         # Summarize processing types detected
         processing_summary = self._summarize_processing()
@@ -535,13 +581,13 @@ class GDPRChecker:
     def _scan_code(self, file_path: Path):
         self.files_scanned += 1
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
+            content = file_path.read_bytes().decode("utf-8", errors="ignore")
             rel = str(file_path.relative_to(self.project_path))
             detections = []
 
-            for category, patterns in GDPR_CODE_PATTERNS.items():
+            for category, patterns in _GDPR_CODE_REGEX.items():
                 for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
+                    if pattern.search(content):
                         detections.append(category)
                         self.detected_patterns.setdefault(category, []).append(rel)
                         break
@@ -554,13 +600,13 @@ class GDPRChecker:
     def _scan_config(self, file_path: Path):
         self.files_scanned += 1
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
+            content = file_path.read_bytes().decode("utf-8", errors="ignore")
             rel = str(file_path.relative_to(self.project_path))
             detections = []
 
-            for category, patterns in GDPR_CONFIG_PATTERNS.items():
+            for category, patterns in _GDPR_CONFIG_REGEX.items():
                 for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
+                    if pattern.search(content):
                         detections.append(category)
                         self.detected_patterns.setdefault(category, []).append(rel)
                         break
@@ -663,8 +709,8 @@ class GDPRChecker:
         for p in [self.project_path / filename, self.project_path / "docs" / filename]:
             if p.exists():
                 try:
-                    content = p.read_text(encoding="utf-8", errors="ignore")
-                    unfilled = len(re.findall(r'\[(?:Your |e\.g\.|Date|Duration|Role|Describe|Email)', content))
+                    content = p.read_bytes().decode("utf-8", errors="ignore")
+                    unfilled = len(_UNFILLED_PLACEHOLDER_RE.findall(content))
                     return {"exists": True, "customized": unfilled <= 2, "unfilled_placeholders": unfilled}
                 except Exception:
                     return {"exists": True, "customized": False, "unfilled_placeholders": -1}
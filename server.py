@@ -5,17 +5,27 @@ Scans projects to detect AI model usage and verify EU AI Act compliance
 """
 
 import ast
+import copy
 import os
 import re
 import json
 import time
 import hashlib
 import secrets
+import shutil
+import sys
+import subprocess
 import logging
+import mmap
 import tempfile
 import contextvars
+import functools
+import inspect
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Annotated, Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Annotated, Dict, List, Any, Optional, Set
 
 from pydantic import Field
 from datetime import datetime, timedelta, timezone
@@ -24,7 +34,10 @@ from enum import Enum
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.types import TextContent
-from gdpr_module import GDPRChecker, GDPR_TEMPLATES, GDPR_REQUIREMENTS
+from gdpr_module import (
+    GDPRChecker, GDPR_TEMPLATES, GDPR_REQUIREMENTS,
+    SKIP_DIRS, _file_suffix, _iter_project_files,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +57,16 @@ def _load_articles_db() -> Dict[str, Any]:
 
 _ARTICLES_DB: Dict[str, Any] = _load_articles_db()
 
+# Lowercased (required_sections, content_keywords) per article, built once so
+# doc scoring in every checker instance only lowercases the document itself.
+_ARTICLE_TERMS_LC: Dict[str, tuple] = {
+    article_id: (
+        tuple(s.lower() for s in article.get("required_sections", [])),
+        tuple(k.lower() for k in article.get("content_keywords", [])),
+    )
+    for article_id, article in _ARTICLES_DB.items()
+}
+
 
 class ApiKeyManager:
     """Loads and validates API keys from both api_keys.json files.
@@ -1321,7 +1344,7 @@ class RateLimitMiddleware:
 
 
 # Config/manifest files to scan for AI dependencies
-CONFIG_FILE_NAMES = {
+CONFIG_FILE_NAMES = frozenset({
     "package.json", "package-lock.json",
     "requirements.txt", "requirements-dev.txt", "requirements_dev.txt",
     "setup.py", "setup.cfg", "pyproject.toml",
@@ -1329,7 +1352,7 @@ CONFIG_FILE_NAMES = {
     "environment.yml", "conda.yml",
     "pom.xml", "build.gradle", "build.gradle.kts",
     "Cargo.toml", "go.mod",
-}
+})
 
 # Patterns for detecting AI dependencies in config/manifest files
 CONFIG_DEPENDENCY_PATTERNS = {
@@ -1503,6 +1526,280 @@ AI_MODEL_PATTERNS = {
         r"Groq\(\)",
     ],
 }
+# Read-only: shared by every scan thread and compiled into the tables below.
+AI_MODEL_PATTERNS = MappingProxyType({fw: tuple(p) for fw, p in AI_MODEL_PATTERNS.items()})
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """Return the longest literal run every match of ``pattern`` must contain.
+
+    Only understands the small regex subset used in the pattern tables above
+    (escaped punctuation, ``\\b``/``\\s`` classes, ``.``, single-character
+    quantifiers, anchors). Anything that could make a run optional -- ``|``,
+    a ``{m,n}`` quantifier, a quantifier or alternation inside a group, or a
+    quantified group -- gives up. The result is lowercased; None means no
+    usable literal was found.
+    """
+    runs: List[str] = []
+    current = ""
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\" and i + 1 < len(pattern):
+            nxt = pattern[i + 1]
+            i += 2
+            if nxt.isalnum():  # \b, \s, \d ... are not literals
+                runs.append(current)
+                current = ""
+            else:
+                current += nxt
+            continue
+        if ch in "|{" or (depth and ch in "*?"):
+            return None
+        if ch in "*?":  # preceding char is optional
+            current = current[:-1]
+            runs.append(current)
+            current = ""
+        elif ch == "+":
+            runs.append(current)
+            current = ""
+        elif ch in ".^$()[]":
+            if ch == "[":
+                i = pattern.index("]", i)
+            elif ch == "(":
+                depth += 1
+            elif ch == ")":
+                depth -= 1
+                if pattern[i + 1:i + 2] in ("?", "*", "{"):
+                    return None
+            runs.append(current)
+            current = ""
+        else:
+            current += ch
+        i += 1
+    runs.append(current)
+    longest = max(runs, key=len)
+    return longest.lower() or None
+
+
+def _build_literal_prefilter(table: Dict[str, List[str]]) -> Dict[str, Optional[tuple]]:
+    """Map each framework to the literals one of which must occur for any pattern to match.
+
+    None means at least one pattern has no literal and the regexes must always run.
+    """
+    prefilter: Dict[str, Optional[tuple]] = {}
+    for framework, patterns in table.items():
+        literals = [_required_literal(p) for p in patterns]
+        prefilter[framework] = None if None in literals else tuple(dict.fromkeys(literals))
+    return prefilter
+
+
+# Cheap substring gate over the lowercased file content: most scanned files
+# contain no AI usage at all, so skip the regexes for frameworks whose
+# literals are absent.
+_AI_PATTERN_LITERALS = _build_literal_prefilter(AI_MODEL_PATTERNS)
+_CONFIG_PATTERN_LITERALS = _build_literal_prefilter(CONFIG_DEPENDENCY_PATTERNS)
+
+# Optional linear-time regex engine (pip install google-re2). Patterns are
+# compiled with an inline (?i) so the same source works under re and re2.
+try:
+    import re2 as _scan_re
+except ImportError:
+    _scan_re = re
+
+
+def _compile_scan_pattern(pattern: str):
+    """Compile a case-insensitive scan pattern, preferring re2 when installed."""
+    if _scan_re is not re:
+        try:
+            return _scan_re.compile("(?i)" + pattern)
+        except Exception:
+            logger.debug("re2 cannot compile %r, using re", pattern)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _plain_pattern(pattern: str) -> Optional[str]:
+    """Return the lowercased text a pattern matches literally, or None if it uses regex syntax.
+
+    Escaped punctuation (``\\.``, ``\\(``) is allowed; classes, quantifiers,
+    anchors and alternation are not. ASCII only, so ``in`` on lowercased
+    content is equivalent to an IGNORECASE search.
+    """
+    text = ""
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return None
+            text += pattern[i + 1]
+            i += 2
+            continue
+        if ch in ".^$*+?{}[]|()":
+            return None
+        text += ch
+        i += 1
+    return text.lower() if text.isascii() else None
+
+
+def _compile_scan_table(table: Dict[str, List[str]]) -> Dict[str, tuple]:
+    """Split each framework's patterns into (plain lowercase literals, compiled regexes).
+
+    Most patterns are plain text; testing those with ``in`` against the
+    lowercased content is much cheaper than a regex search each.
+    """
+    compiled = {}
+    for framework, patterns in table.items():
+        plain, regexes = [], []
+        for p in patterns:
+            literal = _plain_pattern(p)
+            if literal is not None:
+                plain.append(literal)
+            else:
+                regexes.append(_compile_scan_pattern(p))
+        compiled[framework] = (tuple(plain), regexes)
+    return compiled
+
+
+_AI_PATTERNS_COMPILED = _compile_scan_table(AI_MODEL_PATTERNS)
+_CONFIG_PATTERNS_COMPILED = _compile_scan_table(CONFIG_DEPENDENCY_PATTERNS)
+
+
+def _fused_scan_source(table: Dict[str, List[str]]) -> str:
+    """Source of one case-insensitive alternation with a named group per framework."""
+    return "(?i)" + "|".join(
+        "(?P<%s>%s)" % (framework, "|".join(f"(?:{p})" for p in patterns))
+        for framework, patterns in table.items()
+    )
+
+
+def _build_fused_scan_pattern(table: Dict[str, List[str]]):
+    """Compile a table into one alternation with a named group per framework, or None.
+
+    Only used with re2, whose automaton matches an alternation in one pass.
+    Under the stdlib re a fused alternation loses the literal-prefix search
+    each separate pattern gets and measured several times slower.
+    """
+    if _scan_re is re:
+        return None
+    try:
+        return _scan_re.compile(_fused_scan_source(table))
+    except Exception:
+        logger.debug("re2 cannot compile the fused scan pattern, using per-pattern search")
+        return None
+
+
+_AI_PATTERNS_FUSED = _build_fused_scan_pattern(AI_MODEL_PATTERNS)
+_CONFIG_PATTERNS_FUSED = _build_fused_scan_pattern(CONFIG_DEPENDENCY_PATTERNS)
+
+# Optional SIMD multi-pattern engine (pip install hyperscan): every pattern of
+# a table goes into one database, so a single pass over a file reports all
+# matching frameworks at once instead of one regex search per pattern.
+try:
+    import hyperscan as _hs
+except ImportError:
+    _hs = None
+
+
+def _build_hyperscan_db(table: Dict[str, List[str]]):
+    """Compile a pattern table into (database, framework labels), or None."""
+    if _hs is None:
+        return None
+    labels = list(table)
+    expressions, ids = [], []
+    for idx, framework in enumerate(labels):
+        for pattern in table[framework]:
+            expressions.append(pattern.encode())
+            ids.append(idx)
+    flags = [_hs.HS_FLAG_CASELESS | _hs.HS_FLAG_SINGLEMATCH] * len(expressions)
+    try:
+        db = _hs.Database()
+        db.compile(expressions=expressions, ids=ids, elements=len(expressions), flags=flags)
+    except Exception as e:
+        logger.debug("hyperscan cannot compile scan patterns, using re: %s", e)
+        return None
+    return db, labels
+
+
+_AI_PATTERNS_HS = _build_hyperscan_db(AI_MODEL_PATTERNS)
+_CONFIG_PATTERNS_HS = _build_hyperscan_db(CONFIG_DEPENDENCY_PATTERNS)
+
+
+# Optional Aho-Corasick automaton (pip install pyahocorasick): finds which
+# prefilter literals occur in one pass over the content, instead of one
+# substring search per literal per framework.
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+
+def _build_literal_automaton(literals: Dict[str, Optional[tuple]]):
+    """Compile a literal prefilter table into an automaton yielding frameworks, or None."""
+    if _ahocorasick is None:
+        return None
+    owners: Dict[str, List[str]] = defaultdict(list)
+    for framework, required in literals.items():
+        for lit in required or ():
+            owners[lit].append(framework)
+    if not owners:
+        return None
+    automaton = _ahocorasick.Automaton()
+    for lit, frameworks in owners.items():
+        automaton.add_word(lit, tuple(frameworks))
+    automaton.make_automaton()
+    return automaton
+
+
+_AI_LITERALS_AC = _build_literal_automaton(_AI_PATTERN_LITERALS)
+_CONFIG_LITERALS_AC = _build_literal_automaton(_CONFIG_PATTERN_LITERALS)
+
+
+def _detect_frameworks(content: str, compiled: Dict[str, tuple],
+                       literals: Dict[str, Optional[tuple]], hs_db=None,
+                       literal_ac=None, fused=None) -> List[str]:
+    """Return the frameworks (in table order) with at least one pattern matching content."""
+    if hs_db is not None:
+        db, labels = hs_db
+        hits = set()
+        db.scan(content.encode("utf-8"), match_event_handler=lambda idx, *_: hits.add(idx))
+        return [labels[idx] for idx in sorted(hits)]
+
+    content_lc = content.lower()
+    present = None
+    if literal_ac is not None:
+        present = {fw for _, frameworks in literal_ac.iter(content_lc) for fw in frameworks}
+    candidates = []
+    confirmed = set()
+    for framework in compiled:
+        required = literals[framework]
+        if required is not None:
+            if present is not None:
+                if framework not in present:
+                    continue
+            else:
+                hit = next((lit for lit in required if lit in content_lc), None)
+                if hit is None:
+                    continue
+                if hit in compiled[framework][0]:
+                    # The gate literal is a whole plain pattern: already a match.
+                    confirmed.add(framework)
+        candidates.append(framework)
+    if not candidates:
+        return []
+
+    # The fused pass reports non-overlapping matches only, so a framework it
+    # missed may still match; those fall back to their own patterns.
+    if fused is not None:
+        confirmed.update(m.lastgroup for m in fused.finditer(content))
+    detections = []
+    for framework in candidates:
+        plain, regexes = compiled[framework]
+        if (framework in confirmed or any(lit in content_lc for lit in plain)
+                or any(pattern.search(content) for pattern in regexes)):
+            detections.append(framework)
+    return detections
 
 # EU AI Act - Risk categories
 RISK_CATEGORIES = {
@@ -1539,6 +1836,11 @@ RISK_CATEGORIES = {
         ],
     },
 }
+# Read-only view; callers returning requirements copy them into a list.
+RISK_CATEGORIES = MappingProxyType({
+    name: MappingProxyType({**info, "requirements": tuple(info["requirements"])})
+    for name, info in RISK_CATEGORIES.items()
+})
 
 
 # Actionable guidance per compliance check — tells users exactly WHAT, WHY, HOW
@@ -2163,17 +2465,101 @@ BLOCKED_PATHS = [
     "/mnt",
     "/media",
 ]
+# BLOCKED_PATHS entry -> list position, so a validation is one hash lookup per
+# ancestor of the resolved path instead of a prefix test per blocked entry.
+_BLOCKED_PATH_RANK = {blocked: i for i, blocked in reversed(list(enumerate(BLOCKED_PATHS)))}
 
 # Security: max files to scan (prevent DoS)
 MAX_FILES_TO_SCAN = 5000
 MAX_FILE_SIZE_BYTES = 1_000_000  # 1MB
 
-# Directories to skip during scanning (dependencies, build artifacts, VCS)
-SKIP_DIRS = {
-    ".venv", "venv", ".env", "env", "node_modules", ".git",
-    "__pycache__", ".pytest_cache", ".tox", ".mypy_cache",
-    "dist", "build", ".eggs", ".smithery", ".cache",
-}
+# Source file extensions scanned for AI_MODEL_PATTERNS
+CODE_EXTENSIONS = frozenset({".py", ".js", ".ts", ".java", ".go", ".rs", ".cpp", ".c"})
+
+# SKIP_DIRS, _file_suffix and the project walk _iter_project_files are
+# imported from gdpr_module, so both scanners prune the same directories.
+
+
+# Source reads are I/O-bound and release the GIL, so they are overlapped on a
+# small thread pool while matching stays on the scanning thread. Reads are
+# batched to bound how many file contents are held in memory at once.
+_SCAN_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_SCAN_READ_BATCH = 64
+
+
+def _read_source(file_path: Path) -> Any:
+    """Read a file as text, returning the exception instead of raising it.
+
+    One unbuffered read of the whole file and a single decode, instead of
+    read_text's TextIOWrapper decoding chunk by chunk.
+    """
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            return f.read().decode("utf-8", errors="ignore")
+    except Exception as e:
+        return e
+
+
+def _read_sources(candidates: List[tuple]):
+    """Yield ``(candidate, content)`` in order, where candidate[0] is the file path."""
+    if len(candidates) <= 4:
+        for candidate in candidates:
+            yield candidate, _read_source(candidate[0])
+        return
+    with ThreadPoolExecutor(max_workers=_SCAN_READ_WORKERS) as pool:
+        def submit(start: int) -> tuple:
+            batch = candidates[start:start + _SCAN_READ_BATCH]
+            return batch, [pool.submit(_read_source, c[0]) for c in batch]
+
+        # Double-buffered: the next batch is already reading while the caller
+        # matches the current one, so the pool does not idle between batches.
+        ahead = submit(0)
+        for start in range(_SCAN_READ_BATCH, len(candidates) + _SCAN_READ_BATCH, _SCAN_READ_BATCH):
+            batch, futures = ahead
+            if start < len(candidates):
+                ahead = submit(start)
+            for candidate, future in zip(batch, futures):
+                yield candidate, future.result()
+
+
+# When ripgrep is on PATH, one native parallel pass lists the files containing
+# any prefilter literal; every pattern requires one of those literals, so the
+# remaining files cannot match and are counted without being read in Python.
+# Only worth the process spawn on larger trees.
+_RG_PATH = shutil.which("rg")
+_RG_MIN_CANDIDATES = 200
+_RG_TIMEOUT_SECONDS = 60
+
+
+def _rg_files_with_literals(root: Path, candidates: List[tuple]) -> Optional[set]:
+    """Return normalised paths under root that contain a scan literal, or None to scan everything."""
+    if _RG_PATH is None or len(candidates) < _RG_MIN_CANDIDATES:
+        return None
+    literals = set()
+    for table in (_AI_PATTERN_LITERALS, _CONFIG_PATTERN_LITERALS):
+        for framework_literals in table.values():
+            if framework_literals is None:
+                return None
+            literals.update(framework_literals)
+    cmd = [
+        _RG_PATH, "--files-with-matches", "--null", "--no-messages",
+        "--fixed-strings", "--ignore-case", "--text", "--no-ignore", "--hidden",
+        "--max-filesize", str(MAX_FILE_SIZE_BYTES), "--file", "-",
+    ]
+    for skipped in sorted(SKIP_DIRS):
+        cmd += ["--glob", f"!{skipped}"]
+    cmd += ["--", str(root)]
+    try:
+        proc = subprocess.run(
+            cmd, input="\n".join(sorted(literals)), capture_output=True,
+            text=True, timeout=_RG_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug("ripgrep prefilter unavailable: %s", e)
+        return None
+    if proc.returncode not in (0, 1):  # 1 = no file matched
+        return None
+    return {os.path.normpath(p) for p in proc.stdout.split("\0") if p}
 
 
 def _validate_project_path(project_path: str) -> tuple[bool, str]:
@@ -2182,17 +2568,30 @@ def _validate_project_path(project_path: str) -> tuple[bool, str]:
     Returns:
         (is_safe, error_message)
     """
+    # resolve() is not cached: it must see the filesystem (symlinks) as it is now.
     try:
         resolved = Path(project_path).resolve()
     except (ValueError, OSError):
         return False, f"Invalid path: {project_path}"
 
-    resolved_str = str(resolved)
+    return _check_resolved_path(str(resolved), resolved != Path(project_path))
+
+
+@functools.lru_cache(maxsize=256)
+def _check_resolved_path(resolved_str: str, via_link: bool) -> tuple[bool, str]:
+    """Blocked-path checks on an already-resolved path; pure, so memoized.
+
+    ``via_link`` is True when the resolved path differs from the one given.
+    """
+    resolved = Path(resolved_str)
 
-    # Block absolute paths to sensitive directories
-    for blocked in BLOCKED_PATHS:
-        if resolved_str == blocked or resolved_str.startswith(blocked + "/"):
-            return False, f"Access denied: scanning {blocked} is not allowed for security reasons"
+    # Block absolute paths to sensitive directories: the path itself or any
+    # ancestor (the filesystem root only blocks itself, as with a prefix test)
+    candidates = [resolved_str] + [str(a) for a in resolved.parents if a != a.parent]
+    hits = [_BLOCKED_PATH_RANK[c] for c in candidates if c in _BLOCKED_PATH_RANK]
+    if hits:
+        blocked = BLOCKED_PATHS[min(hits)]
+        return False, f"Access denied: scanning {blocked} is not allowed for security reasons"
 
     # Block /home at insufficient depth or sensitive subdirectories
     # /home → blocked, /home/user → blocked, /home/user/.ssh → blocked
@@ -2207,7 +2606,7 @@ def _validate_project_path(project_path: str) -> tuple[bool, str]:
             return False, "Access denied: scanning /home is not allowed for security reasons"
 
     # Block symlinks that escape to blocked paths
-    if resolved != Path(project_path):
+    if via_link:
         for blocked in BLOCKED_PATHS:
             if resolved_str.startswith(blocked + "/"):
                 return False, f"Access denied: symlink resolves to blocked path"
@@ -2320,20 +2719,106 @@ def _resolve_import_to_file(mod_name: str, module_to_file: Dict[str, str], out:
             break
 
 
-def _build_python_import_graph(project_path: Path) -> Dict[str, List[str]]:
-    """Build a forward import graph for Python files in the project.
+# (path, mtime_ns, size) -> absolute module names the file imports. A file's
+# imports do not depend on which project root it is scanned under, so repeat
+# follow_imports scans of unchanged files skip the read and ast.parse.
+# Concurrent scans share it, so eviction and insertion hold the lock.
+_PY_IMPORTS_CACHE: Dict[tuple, tuple] = {}
+_PY_IMPORTS_CACHE_MAX = 4096
+_PY_IMPORTS_CACHE_LOCK = threading.Lock()
 
-    Returns {rel_file_path: [imported_rel_file_paths]}.
-    Only intra-project imports are tracked (external packages ignored).
+
+# Also collect imports nested in function and class bodies (lazy imports in
+# handlers are common). Setting this False skips those bodies entirely. Read
+# on each visit, so it can be changed at runtime; files already parsed keep
+# their entry in _PY_IMPORTS_CACHE.
+_FOLLOW_NESTED_IMPORTS = True
+
+
+class ImportCollector:
+    """Collect absolute (level 0) imported module names from a parsed module.
+
+    Imports are statements, so only statement containers are descended into;
+    expression subtrees, which make up most of a module's nodes, are never
+    visited. Dispatch is a per-type table instead of NodeVisitor's getattr.
     """
+
+    _DISPATCH = {
+        ast.Import: "_v_import",
+        ast.ImportFrom: "_v_import_from",
+        ast.Module: "generic_visit",
+        ast.If: "generic_visit",
+        ast.Try: "generic_visit",
+        ast.ExceptHandler: "generic_visit",
+        ast.With: "generic_visit",
+        ast.AsyncWith: "generic_visit",
+        ast.For: "generic_visit",
+        ast.AsyncFor: "generic_visit",
+        ast.While: "generic_visit",
+        ast.FunctionDef: "_v_body",
+        ast.AsyncFunctionDef: "_v_body",
+        ast.ClassDef: "_v_body",
+    }
+    if hasattr(ast, "Match"):
+        _DISPATCH.update({ast.Match: "generic_visit", ast.match_case: "generic_visit"})
+    if hasattr(ast, "TryStar"):
+        _DISPATCH[ast.TryStar] = "generic_visit"
+
+    def __init__(self):
+        self.names: List[str] = []
+
+    def visit(self, node: ast.AST) -> None:
+        method = self._DISPATCH.get(type(node))
+        if method:
+            getattr(self, method)(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        dispatch = self._DISPATCH
+        for child in ast.iter_child_nodes(node):
+            if type(child) in dispatch:
+                self.visit(child)
+
+    def _v_body(self, node: ast.AST) -> None:
+        # Decorators, arguments and bases are expressions; only the body can import.
+        if not _FOLLOW_NESTED_IMPORTS:
+            return
+        for child in node.body:
+            if type(child) in self._DISPATCH:
+                self.visit(child)
+
+    def _v_import(self, node: ast.Import) -> None:
+        self.names.extend(alias.name for alias in node.names)
+
+    def _v_import_from(self, node: ast.ImportFrom) -> None:
+        if node.module and node.level == 0:
+            self.names.append(node.module)
+
+
+def _parse_python_imports(content: str, filename: str) -> tuple:
+    """Return the absolute (level 0) module names imported by Python source; () on syntax errors."""
+    try:
+        tree = ast.parse(content, filename=filename)
+    except SyntaxError:
+        return ()
+    collector = ImportCollector()
+    collector.visit(tree)
+    return tuple(collector.names)
+
+
+def _python_file_key(entry: os.DirEntry) -> tuple:
+    """(Path, import-cache key) for a .py DirEntry; the key is None if it cannot be stat'ed."""
+    try:
+        st = entry.stat(follow_symlinks=False)
+        return Path(entry.path), (entry.path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return Path(entry.path), None
+
+
+def _index_python_modules(project_path: Path, py_files: List[tuple]) -> tuple:
+    """Return ({dotted module: rel path}, regex matching any project top-level module name)."""
     # Map dotted module name → relative file path
     module_to_file: Dict[str, str] = {}
-    all_py_files: List[Path] = []
-
-    for py_file in project_path.rglob("*.py"):
-        if SKIP_DIRS.intersection(py_file.parts):
-            continue
-        all_py_files.append(py_file)
+    for py_file, _ in py_files:
         rel = str(py_file.relative_to(project_path))
         mod = rel.replace("\\", "/").replace("/", ".")
         if mod.endswith(".py"):
@@ -2342,38 +2827,157 @@ def _build_python_import_graph(project_path: Path) -> Dict[str, List[str]]:
             mod = mod[:-9]
         module_to_file[mod] = rel
 
+    # An import can only resolve to a project file if it names that module's
+    # top-level package, so files mentioning none of them skip ast.parse.
+    tops = sorted({mod.split(".", 1)[0] for mod in module_to_file})
+    mentions_project = re.compile(r"\b(?:%s)\b" % "|".join(map(re.escape, tops)))
+    return module_to_file, mentions_project
+
+
+def _python_file_imports(py_file: Path, cache_key: Optional[tuple], content: Optional[str],
+                         mentions_project) -> tuple:
+    """Return the absolute module names a file imports, from the cache or by parsing.
+
+    ``content`` is read from disk when not supplied. Files that name no project
+    module get () without a parse, and that result is not cached since it
+    depends on the project being scanned.
+    """
+    imports = _PY_IMPORTS_CACHE.get(cache_key) if cache_key else None
+    if imports is not None:
+        return imports
+    if content is None:
+        # Read whole even past MAX_FILE_SIZE_BYTES: a module too large for the
+        # pattern scan can still link AI-flagged files to its importers.
+        content = py_file.read_bytes().decode("utf-8", errors="ignore")
+    if not mentions_project.search(content):
+        return ()
+    imports = _parse_python_imports(content, str(py_file))
+    if cache_key:
+        with _PY_IMPORTS_CACHE_LOCK:
+            if len(_PY_IMPORTS_CACHE) >= _PY_IMPORTS_CACHE_MAX:
+                _PY_IMPORTS_CACHE.pop(next(iter(_PY_IMPORTS_CACHE)))
+            _PY_IMPORTS_CACHE[cache_key] = imports
+    return imports
+
+
+def _build_python_import_graph(project_path: Path, py_files: Optional[List[tuple]] = None,
+                               known_imports: Optional[Dict[Path, tuple]] = None) -> Dict[str, List[str]]:
+    """Build a forward import graph for Python files in the project.
+
+    Returns {rel_file_path: [imported_rel_file_paths]}.
+    Only intra-project imports are tracked (external packages ignored).
+    ``py_files`` ((Path, cache key) pairs) and ``known_imports`` ({Path: module
+    names}) let a caller that already walked and read the project skip both.
+    """
+    if py_files is None:
+        py_files = [
+            _python_file_key(entry) for entry in _iter_project_files(project_path)
+            if entry.name.endswith(".py")
+        ]
+    module_to_file, mentions_project = _index_python_modules(project_path, py_files)
+    known_imports = known_imports or {}
+
     forward_graph: Dict[str, List[str]] = {}
+    for py_file, cache_key in py_files:
+        imports = known_imports.get(py_file)
+        if imports is None:
+            imports = _python_file_imports(py_file, cache_key, None, mentions_project)
 
-    for py_file in all_py_files:
-        rel = str(py_file.relative_to(project_path))
         deps: List[str] = []
-        try:
-            content = py_file.read_text(encoding="utf-8", errors="ignore")
-            tree = ast.parse(content, filename=str(py_file))
-        except SyntaxError:
-            forward_graph[rel] = deps
-            continue
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    _resolve_import_to_file(alias.name, module_to_file, deps)
-            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
-                _resolve_import_to_file(node.module, module_to_file, deps)
+        for name in imports:
+            _resolve_import_to_file(name, module_to_file, deps)
 
-        forward_graph[rel] = list(set(deps))
+        forward_graph[str(py_file.relative_to(project_path))] = list(set(deps))
 
     return forward_graph
 
 
+# Default file systems on macOS and Windows are case-insensitive: there
+# Path("readme.md").exists() finds README.md, so the doc listings compare
+# casefolded names to keep the same answer.
+_FS_CASE_INSENSITIVE = sys.platform in ("darwin", "win32")
+
+
+def _fs_name_key(name: str) -> str:
+    """Name as compared in the doc listings: casefolded on case-insensitive platforms."""
+    return name.casefold() if _FS_CASE_INSENSITIVE else name
+
+
+# Generated-content markers, matched directly on the file bytes. re.I only
+# folds ASCII, so the accented letters list both UTF-8 cases explicitly.
+_CONTENT_MARKER_RE = re.compile(
+    rb"generated by ai"
+    rb"|g\xc3[\xa9\x89]n\xc3[\xa9\x89]r\xc3[\xa9\x89] par ia"
+    rb"|ai-generated"
+    rb"|machine-generated",
+    re.IGNORECASE,
+)
+
+# README wording that counts as disclosing AI usage, as whole words.
+_AI_DISCLOSURE_KEYWORDS = (
+    "ai", "artificial intelligence", "intelligence artificielle", "machine learning",
+    "deep learning", "gpt", "claude", "llm",
+)
+_AI_DISCLOSURE_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(k) for k in _AI_DISCLOSURE_KEYWORDS) + r")\b",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _fail_recommendation(check: str) -> Dict[str, Any]:
+    """FAIL recommendation for a compliance check, built once per check name.
+
+    Shared across reports: callers append a copy.
+    """
+    guidance = ACTIONABLE_GUIDANCE.get(check, {})
+    return {
+        "check": check,
+        "status": "FAIL",
+        "what": guidance.get("what", f"Missing: {check.replace('_', ' ')}"),
+        "why": guidance.get("why", "Required by EU AI Act"),
+        "how": guidance.get("how", [f"Create {check}.md documentation"]),
+        "template_available": check in COMPLIANCE_TEMPLATES,
+        "eu_article": guidance.get("eu_article", ""),
+        "effort": guidance.get("effort", "medium"),
+    }
+
+
+# Extra step every high-risk report ends with (Art. 60 registration)
+_EU_DATABASE_RECOMMENDATION = {
+    "check": "eu_database_registration",
+    "status": "ACTION_REQUIRED",
+    "what": "Register system in EU AI database before deployment",
+    "why": "Art. 60 - Mandatory for all high-risk AI systems",
+    "how": [
+        "Go to https://ec.europa.eu/ai-act-database (when available)",
+        "Prepare: system name, provider info, intended purpose, risk category",
+        "Submit registration BEFORE placing system on market",
+    ],
+    "eu_article": "Art. 60",
+    "effort": "low",
+}
+
+
 class EUAIActChecker:
     """EU AI Act compliance checker"""
 
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
-        self.detected_models = {}
+        # framework -> set of relative file paths; scan_project returns sorted copies
+        self.detected_models: Dict[str, Set[str]] = defaultdict(set)
         self.files_scanned = 0
         self.ai_files = []
+        # Lazily built directory listings shared by the _check_* helpers.
+        # The root/docs listing is re-read whenever either directory's mtime
+        # changes; the .py list is kept until refresh().
+        self._doc_names: Optional[tuple] = None
+        self._py_files: Optional[List[Path]] = None
+
+    def refresh(self) -> None:
+        """Forget cached directory listings so the next checks see the current tree."""
+        self._doc_names = None
+        self._py_files = None
 
     def scan_project(self, follow_imports: bool = False) -> Dict[str, Any]:
         """Scan the project to detect AI model usage.
@@ -2396,44 +3000,85 @@ class EUAIActChecker:
                 "detected_models": {},
             }
 
-        # File extensions to scan
-        code_extensions = {".py", ".js", ".ts", ".java", ".go", ".rs", ".cpp", ".c"}
-
-        for file_path in self.project_path.rglob("*"):
-            if SKIP_DIRS.intersection(file_path.parts):
-                continue
-            if self.files_scanned >= MAX_FILES_TO_SCAN:
+        self.refresh()
+        self.detected_models = defaultdict(set)
+        self.files_scanned = 0
+        self.ai_files = []
+        # With follow_imports, note every .py file during this walk so the
+        # import graph can reuse it; dropped if the walk stops early.
+        py_files: Optional[List[tuple]] = [] if follow_imports else None
+        candidates: List[tuple] = []
+        for entry in _iter_project_files(self.project_path):
+            if len(candidates) >= MAX_FILES_TO_SCAN:
                 logger.warning("Max files limit reached (%d)", MAX_FILES_TO_SCAN)
+                py_files = None
                 break
-            if not file_path.is_file():
+            name = entry.name
+            if py_files is not None and name.endswith(".py"):
+                py_files.append(_python_file_key(entry))
+            is_code = _file_suffix(name) in CODE_EXTENSIONS
+            if not is_code and name not in CONFIG_FILE_NAMES:
                 continue
             try:
-                if file_path.stat().st_size > MAX_FILE_SIZE_BYTES:
+                if entry.stat(follow_symlinks=False).st_size > MAX_FILE_SIZE_BYTES:
                     continue
             except OSError:
                 continue
-            if file_path.suffix in code_extensions:
-                self._scan_file(file_path)
-            elif file_path.name in CONFIG_FILE_NAMES:
-                self._scan_config_file(file_path)
+            candidates.append((Path(entry.path), is_code))
+        else:
+            # The walk finished, so its .py candidates double as the
+            # content-marking file list.
+            self._py_files = [path for path, _ in candidates if path.name.endswith(".py")]
+
+        rg_hits = _rg_files_with_literals(self.project_path, candidates)
+        if rg_hits is not None:
+            matching = [c for c in candidates if os.path.normpath(str(c[0])) in rg_hits]
+            self.files_scanned += len(candidates) - len(matching)
+            candidates = matching
+
+        # Collect import names from the sources as they are read, so the
+        # follow_imports graph does not read and parse them a second time.
+        import_keys: Dict[Path, Optional[tuple]] = {}
+        known_imports: Dict[Path, tuple] = {}
+        if py_files is not None:
+            import_keys = dict(py_files)
+            _, mentions_project = _index_python_modules(self.project_path, py_files)
+
+        for (file_path, is_code), content in _read_sources(candidates):
+            if is_code:
+                self._scan_file(file_path, content)
+            else:
+                self._scan_config_file(file_path, content)
+            if file_path in import_keys and isinstance(content, str):
+                known_imports[file_path] = _python_file_imports(
+                    file_path, import_keys[file_path], content, mentions_project
+                )
 
+        # Files arrive in scandir order, which depends on the file system
+        self.ai_files.sort(key=lambda entry: entry["file"])
         result: Dict[str, Any] = {
             "files_scanned": self.files_scanned,
             "ai_files": self.ai_files,
-            "detected_models": self.detected_models,
         }
 
         if follow_imports:
-            propagated = self._propagate_ai_risk_via_imports()
+            propagated = self._propagate_ai_risk_via_imports(py_files, known_imports)
             result["propagated_files"] = propagated
             result["follow_imports_applied"] = True
 
+        result["detected_models"] = {
+            fw: sorted(files) for fw, files in self.detected_models.items()
+        }
         return result
 
-    def _propagate_ai_risk_via_imports(self) -> List[Dict[str, Any]]:
+    def _propagate_ai_risk_via_imports(self, py_files: Optional[List[tuple]] = None,
+                                       known_imports: Optional[Dict[Path, tuple]] = None
+                                       ) -> List[Dict[str, Any]]:
         """Propagate AI risk labels to Python files that import from AI-flagged files.
 
-        Uses a reverse BFS from directly-flagged files through the import graph.
+        Walks the reverse import graph outward from directly-flagged files, one
+        frontier of newly-flagged files per round. ``py_files`` and
+        ``known_imports`` are passed through to _build_python_import_graph.
         Returns the list of newly-propagated file entries (not already in ai_files).
         Also updates self.detected_models so these files appear in compliance checks.
         """
@@ -2443,89 +3088,94 @@ class EUAIActChecker:
         if not direct_ai_frameworks:
             return []
 
-        forward_graph = _build_python_import_graph(self.project_path)
+        forward_graph = _build_python_import_graph(self.project_path, py_files, known_imports)
 
         # Build reverse graph: dep → [files that import dep]
         reverse_graph: Dict[str, List[str]] = {}
-        for src, deps in forward_graph.items():
-            for dep in deps:
+        for src in sorted(forward_graph):
+            for dep in forward_graph[src]:
                 reverse_graph.setdefault(dep, []).append(src)
 
-        # BFS: track {file → frameworks} for all visited nodes
+        # Semi-naive closure: each round only joins the files flagged in the
+        # previous round against the reverse graph, so every edge is examined
+        # once. Round-by-round order matches a FIFO BFS.
         visited_frameworks: Dict[str, List[str]] = dict(direct_ai_frameworks)
-        queue: List[str] = list(direct_ai_frameworks.keys())
+        frontier: List[str] = list(direct_ai_frameworks)
         propagated: List[Dict[str, Any]] = []
 
-        while queue:
-            current = queue.pop(0)
-            current_frameworks = visited_frameworks.get(current, [])
+        while frontier:
+            new_frontier: List[str] = []
+            for current in frontier:
+                current_frameworks = visited_frameworks[current]
 
-            for importer in reverse_graph.get(current, []):
-                if importer not in visited_frameworks:
+                for importer in reverse_graph.get(current, ()):
+                    if importer in visited_frameworks:
+                        continue
                     visited_frameworks[importer] = list(current_frameworks)
-                    queue.append(importer)
+                    new_frontier.append(importer)
 
                     propagated.append({
                         "file": importer,
-                        "transitive_frameworks": list(set(current_frameworks)),
+                        "transitive_frameworks": sorted(set(current_frameworks)),
                         "imports_from": current,
                         "propagated": True,
                     })
 
                     # Add to detected_models so compliance checks include these files
                     for fw in current_frameworks:
-                        if fw not in self.detected_models:
-                            self.detected_models[fw] = []
-                        if importer not in self.detected_models[fw]:
-                            self.detected_models[fw].append(importer)
+                        self.detected_models[fw].add(importer)
+            frontier = new_frontier
 
         return propagated
 
-    def _scan_file(self, file_path: Path):
+    def _scan_file(self, file_path: Path, content: Any = None):
         """Scan a file for AI patterns"""
         self.files_scanned += 1
+        rel = str(file_path.relative_to(self.project_path))
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-
-            file_detections = []
-            for framework, patterns in AI_MODEL_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        file_detections.append(framework)
-                        if framework not in self.detected_models:
-                            self.detected_models[framework] = []
-                        self.detected_models[framework].append(str(file_path.relative_to(self.project_path)))
-                        break  # One detection per framework per file
+            if content is None:
+                content = _read_source(file_path)
+            if isinstance(content, Exception):
+                raise content
+
+            # One detection per framework per file
+            file_detections = _detect_frameworks(
+                content, _AI_PATTERNS_COMPILED, _AI_PATTERN_LITERALS, _AI_PATTERNS_HS,
+                _AI_LITERALS_AC, _AI_PATTERNS_FUSED,
+            )
+            for framework in file_detections:
+                self.detected_models[framework].add(rel)
 
             if file_detections:
                 self.ai_files.append({
-                    "file": str(file_path.relative_to(self.project_path)),
-                    "frameworks": list(set(file_detections)),
+                    "file": rel,
+                    "frameworks": file_detections,
                 })
 
         except Exception as e:
             logger.warning("Error scanning %s: %s", file_path, e)
 
-    def _scan_config_file(self, file_path: Path):
+    def _scan_config_file(self, file_path: Path, content: Any = None):
         """Scan a config/manifest file for AI dependency declarations"""
         self.files_scanned += 1
+        rel = str(file_path.relative_to(self.project_path))
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-
-            file_detections = []
-            for framework, patterns in CONFIG_DEPENDENCY_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        file_detections.append(framework)
-                        if framework not in self.detected_models:
-                            self.detected_models[framework] = []
-                        self.detected_models[framework].append(str(file_path.relative_to(self.project_path)))
-                        break
+            if content is None:
+                content = _read_source(file_path)
+            if isinstance(content, Exception):
+                raise content
+
+            file_detections = _detect_frameworks(
+                content, _CONFIG_PATTERNS_COMPILED, _CONFIG_PATTERN_LITERALS, _CONFIG_PATTERNS_HS,
+                _CONFIG_LITERALS_AC, _CONFIG_PATTERNS_FUSED,
+            )
+            for framework in file_detections:
+                self.detected_models[framework].add(rel)
 
             if file_detections:
                 self.ai_files.append({
-                    "file": str(file_path.relative_to(self.project_path)),
-                    "frameworks": list(set(file_detections)),
+                    "file": rel,
+                    "frameworks": file_detections,
                     "source": "config",
                 })
 
@@ -2551,8 +3201,11 @@ class EUAIActChecker:
         category_info = RISK_CATEGORIES[risk_category]
         requirements = category_info["requirements"]
 
+        # One listing of the root and docs/ serves every existence check below
+        doc_names = self._list_doc_names()
+
         # --- v1: existence-based compliance_status ---
-        readme_exists = (self.project_path / "README.md").exists()
+        readme_exists = _fs_name_key("README.md") in doc_names[0]
         compliance_status: Dict[str, bool] = {}
 
         # --- v2: content scores (0-100) and article map ---
@@ -2561,7 +3214,7 @@ class EUAIActChecker:
 
         # Helper: score + threshold → bool (40+ = pass)
         def _score_and_record(check_key: str, filename: str, article_id: str) -> bool:
-            score = self._score_doc_content(filename, article_id)
+            score = self._score_doc_content(filename, article_id, doc_names)
             content_scores[filename] = score
             status = "pass" if score >= 40 else ("partial" if score > 0 else "fail")
             article_map[article_id] = {"status": status, "score": score, "check": check_key}
@@ -2606,7 +3259,7 @@ class EUAIActChecker:
             # v1 fields (backward compatible)
             "risk_category": risk_category,
             "description": category_info["description"],
-            "requirements": requirements,
+            "requirements": list(requirements),
             "compliance_status": compliance_status,
             "compliance_score": f"{passed_checks}/{total_checks}",
             "compliance_percentage": round((passed_checks / total_checks) * 100, 1) if total_checks > 0 else 0,
@@ -2627,71 +3280,114 @@ class EUAIActChecker:
 
         return result
 
+    def _list_doc_names(self) -> tuple:
+        """Return (names in project root, names in docs/), keyed with _fs_name_key.
+
+        Cached while the mtimes of the root and docs/ are unchanged, so a
+        document added mid-session is seen without refresh().
+        """
+        directories = (self.project_path, self.project_path / "docs")
+        stamp = []
+        for directory in directories:
+            try:
+                stamp.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        stamp = tuple(stamp)
+        if self._doc_names is None or self._doc_names[0] != stamp:
+            listings = []
+            for directory in directories:
+                try:
+                    with os.scandir(directory) as it:
+                        listings.append(frozenset(_fs_name_key(entry.name) for entry in it))
+                except OSError:
+                    listings.append(frozenset())
+            self._doc_names = (stamp, listings[0], listings[1])
+        return self._doc_names[1], self._doc_names[2]
+
+    def _list_python_files(self) -> List[Path]:
+        """Return the project's .py files within the size cap, walked once per refresh()."""
+        if self._py_files is None:
+            py_files = []
+            for entry in _iter_project_files(self.project_path):
+                if not entry.name.endswith(".py"):
+                    continue
+                try:
+                    if entry.stat(follow_symlinks=False).st_size > MAX_FILE_SIZE_BYTES:
+                        continue
+                except OSError:
+                    continue
+                py_files.append(Path(entry.path))
+            self._py_files = py_files
+        return self._py_files
+
     def _check_technical_docs(self) -> bool:
         """Check for technical documentation"""
-        docs = ["README.md", "ARCHITECTURE.md", "API.md", "docs/"]
-        return any((self.project_path / doc).exists() for doc in docs)
+        root_names, _ = self._list_doc_names()
+        return not root_names.isdisjoint(map(_fs_name_key, ("README.md", "ARCHITECTURE.md", "API.md", "docs")))
 
     def _check_file_exists(self, filename: str) -> bool:
         """Check if a file exists"""
-        return (self.project_path / filename).exists() or (self.project_path / "docs" / filename).exists()
+        root_names, docs_names = self._list_doc_names()
+        key = _fs_name_key(filename)
+        return key in root_names or key in docs_names
 
     def _check_ai_disclosure(self) -> bool:
         """Check if the project clearly discloses AI usage"""
-        readme_path = self.project_path / "README.md"
-        if readme_path.exists():
-            content = readme_path.read_text(encoding="utf-8", errors="ignore").lower()
-            ai_keywords = ["ai", "artificial intelligence", "intelligence artificielle", "machine learning", "deep learning", "gpt", "claude", "llm"]
-            return any(keyword in content for keyword in ai_keywords)
-        return False
+        root_names, _ = self._list_doc_names()
+        if _fs_name_key("README.md") not in root_names:
+            return False
+        try:
+            content = (self.project_path / "README.md").read_bytes().decode("utf-8", errors="ignore")
+        except OSError:
+            return False
+        return _AI_DISCLOSURE_RE.search(content) is not None
 
     def _check_content_marking(self) -> bool:
         """Check if generated content is properly marked"""
-        markers = [
-            "generated by ai",
-            "généré par ia",
-            "ai-generated",
-            "machine-generated",
-        ]
-        for file_path in self.project_path.rglob("*.py"):
-            if SKIP_DIRS.intersection(file_path.parts):
-                continue
-            if file_path.is_file():
-                try:
-                    content = file_path.read_text(encoding="utf-8", errors="ignore").lower()
-                    if any(marker in content for marker in markers):
-                        return True
-                except OSError:
-                    pass
+        for py_file in self._list_python_files():
+            try:
+                with open(py_file, "rb") as f:
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            found = _CONTENT_MARKER_RE.search(mm) is not None
+                    except (OSError, ValueError):
+                        # Empty file, or a file system without mmap: plain bytes read
+                        found = _CONTENT_MARKER_RE.search(f.read()) is not None
+                if found:
+                    return True
+            except OSError:
+                pass
         return False
 
-    def _score_doc_content(self, filename: str, article_id: str) -> int:
+    def _score_doc_content(self, filename: str, article_id: str, doc_names: Optional[tuple] = None) -> int:
         """Score a compliance document's content quality 0-100.
 
         Checks presence of required_sections and content_keywords from the articles DB.
         Returns 0 if file doesn't exist, up to 100 for a complete document.
+        doc_names is a precomputed _list_doc_names() result.
         """
         # Find the file (root or docs/ subdirectory)
+        root_names, docs_names = doc_names if doc_names is not None else self._list_doc_names()
         file_path = None
-        for candidate in [self.project_path / filename, self.project_path / "docs" / filename]:
-            if candidate.exists():
-                file_path = candidate
-                break
+        key = _fs_name_key(filename)
+        if key in root_names:
+            file_path = self.project_path / filename
+        elif key in docs_names:
+            file_path = self.project_path / "docs" / filename
 
         if file_path is None:
             return 0
 
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
+            content = file_path.read_bytes().decode("utf-8", errors="ignore")
         except OSError:
             return 0
 
         if len(content.strip()) < 50:
             return 5  # File exists but essentially empty
 
-        article = _ARTICLES_DB.get(article_id, {})
-        required_sections = article.get("required_sections", [])
-        content_keywords = article.get("content_keywords", [])
+        required_sections, content_keywords = _ARTICLE_TERMS_LC.get(article_id, ((), ()))
 
         content_lower = content.lower()
         score = 0
@@ -2700,14 +3396,14 @@ class EUAIActChecker:
         if required_sections:
             per_section = min(60 // len(required_sections), 10)
             for section in required_sections:
-                if section.lower() in content_lower:
+                if section in content_lower:
                     score += per_section
 
         # Keyword presence: up to 30 points
         if content_keywords:
             per_kw = min(30 // len(content_keywords), 5)
             for kw in content_keywords:
-                if kw.lower() in content_lower:
+                if kw in content_lower:
                     score += per_kw
 
         # Length bonus: +10 for substantive content
@@ -2716,11 +3412,18 @@ class EUAIActChecker:
 
         return min(score, 100)
 
-    def generate_report(self, scan_results: Dict, compliance_results: Dict) -> Dict[str, Any]:
-        """Generate a complete compliance report"""
+    def generate_report(self, scan_results: Dict, compliance_results: Dict,
+                        now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Generate a complete compliance report.
+
+        now: report timestamp (UTC); callers producing several reports can pass
+        one shared value. Defaults to the current time.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
         risk_category = compliance_results.get("risk_category", "limited")
         report = {
-            "report_date": datetime.now(timezone.utc).isoformat(),
+            "report_date": now.isoformat(),
             "project_path": str(self.project_path),
             "scan_summary": {
                 "files_scanned": scan_results.get("files_scanned", 0),
@@ -2741,7 +3444,7 @@ class EUAIActChecker:
         }
 
         # v2: Executive summary (DPO/legal audience)
-        days_to_deadline = (datetime(2026, 8, 2, tzinfo=timezone.utc) - datetime.now(timezone.utc)).days
+        days_to_deadline = (datetime(2026, 8, 2, tzinfo=timezone.utc) - now).days
         compliance_pct = compliance_results.get("compliance_percentage", 0)
         gaps = [k for k, v in compliance_results.get("compliance_status", {}).items() if not v]
 
@@ -2781,42 +3484,67 @@ class EUAIActChecker:
         risk_category = compliance_results.get("risk_category", "limited")
 
         for check, passed in compliance_status.items():
-            if not passed:
-                guidance = ACTIONABLE_GUIDANCE.get(check, {})
-                recommendations.append({
-                    "check": check,
-                    "status": "FAIL",
-                    "what": guidance.get("what", f"Missing: {check.replace('_', ' ')}"),
-                    "why": guidance.get("why", "Required by EU AI Act"),
-                    "how": guidance.get("how", [f"Create {check}.md documentation"]),
-                    "template_available": check in COMPLIANCE_TEMPLATES,
-                    "eu_article": guidance.get("eu_article", ""),
-                    "effort": guidance.get("effort", "medium"),
-                })
+            if passed:
+                recommendations.append({"check": check, "status": "PASS"})
             else:
-                recommendations.append({
-                    "check": check,
-                    "status": "PASS",
-                })
+                recommendations.append(dict(_fail_recommendation(check)))
 
         if risk_category == "high":
-            recommendations.append({
-                "check": "eu_database_registration",
-                "status": "ACTION_REQUIRED",
-                "what": "Register system in EU AI database before deployment",
-                "why": "Art. 60 - Mandatory for all high-risk AI systems",
-                "how": [
-                    "Go to https://ec.europa.eu/ai-act-database (when available)",
-                    "Prepare: system name, provider info, intended purpose, risk category",
-                    "Submit registration BEFORE placing system on market",
-                ],
-                "eu_article": "Art. 60",
-                "effort": "low",
-            })
+            recommendations.append(dict(_EU_DATABASE_RECOMMENDATION))
 
         return recommendations
 
 
+def _project_signature(project_path: str) -> Optional[tuple]:
+    """Fingerprint a project tree: root mtime plus (path, mtime, size) of every file.
+
+    One stat per file and no reads, so any edit, addition or removal of a
+    scanned file changes it. None for trees too large to be worth caching.
+    """
+    try:
+        root_mtime = os.stat(project_path).st_mtime_ns
+    except OSError:
+        return (None,)
+    digest = hashlib.blake2b(digest_size=16)
+    for count, entry in enumerate(_iter_project_files(Path(project_path))):
+        if count >= MAX_FILES_TO_SCAN:
+            return None
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        digest.update(f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8", "surrogateescape"))
+    return root_mtime, digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_scan(project_path: str, follow_imports: bool, signature: tuple) -> tuple:
+    checker = EUAIActChecker(project_path)
+    return checker, checker.scan_project(follow_imports=follow_imports)
+
+
+def _get_checker(project_path: str, follow_imports: bool = False) -> tuple:
+    """Return (checker, scan results) for a project, reusing the scan of an unchanged tree.
+
+    Back-to-back tool calls on the same project share one scanned checker: the
+    instance is the cached one, used by every caller and thread, so treat it as
+    read-only. The results are a deep copy each call and may be modified.
+    Blocked paths are never walked for a signature; they scan (and fail) as usual.
+    """
+    is_safe, _ = _validate_project_path(project_path)
+    signature = _project_signature(project_path) if is_safe else None
+    if signature is None:
+        checker = EUAIActChecker(project_path)
+        return checker, checker.scan_project(follow_imports=follow_imports)
+    checker, scan_results = _cached_scan(project_path, follow_imports, signature)
+    return checker, copy.deepcopy(scan_results)
+
+
+def _clear_checker_cache() -> None:
+    """Drop every cached scan (tests, or after patching scan behaviour)."""
+    _cached_scan.cache_clear()
+
+
 class RiskCategory(str, Enum):
     """EU AI Act risk categories"""
     unacceptable = "unacceptable"
@@ -3345,6 +4073,24 @@ def _compute_combined_requirements(
     risk_category: str,
 ) -> Dict[str, Any]:
     """Compute combined GDPR + EU AI Act requirements for a dual-flagged file."""
+    overlap_types, requirements, priority = _combined_requirements_cached(
+        frozenset(gdpr_categories), risk_category
+    )
+    return {
+        "overlap_type": list(overlap_types),
+        "requirements": list(requirements),
+        "priority": priority,
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _combined_requirements_cached(gdpr_categories: frozenset, risk_category: str) -> tuple:
+    """Memoized core of _compute_combined_requirements: (overlap_types, requirements, priority).
+
+    Pure in (GDPR categories, risk category); the result depends on neither the
+    frameworks nor category order, and is returned as tuples so cached values
+    cannot be mutated by callers.
+    """
     requirements: List[str] = []
     overlap_types: List[str] = []
 
@@ -3410,11 +4156,7 @@ def _compute_combined_requirements(
     else:
         priority = "low"
 
-    return {
-        "overlap_type": overlap_types,
-        "requirements": requirements,
-        "priority": priority,
-    }
+    return tuple(overlap_types), tuple(requirements), priority
 
 
 def _generate_combined_insight(
@@ -3536,8 +4278,7 @@ def create_server():
         resolved_path, is_demo, error_msg = _resolve_project_path(project_path)
         if error_msg:
             return {"error": error_msg, "detected_models": {}}
-        checker = EUAIActChecker(resolved_path)
-        scan_raw = checker.scan_project(follow_imports=follow_imports)
+        checker, scan_raw = _get_checker(resolved_path, follow_imports)
         plan = _get_plan()
         cta_included = plan not in ("pro", "paid_scan", "marketplace", "certified")
         scan_id = _generate_scan_id()
@@ -3567,8 +4308,7 @@ def create_server():
         resolved_path, is_demo, error_msg = _resolve_project_path(project_path)
         if error_msg:
             return {"error": error_msg}
-        checker = EUAIActChecker(resolved_path)
-        checker.scan_project()
+        checker, _ = _get_checker(resolved_path)
         plan = _get_plan()
         scan_id = _generate_scan_id()
         _log_tool_call("check_compliance", cta_included=plan not in ("pro", "paid_scan", "marketplace", "certified"),
@@ -3590,8 +4330,7 @@ def create_server():
         resolved_path, is_demo, error_msg = _resolve_project_path(project_path)
         if error_msg:
             return {"error": error_msg}
-        checker = EUAIActChecker(resolved_path)
-        scan_results = checker.scan_project()
+        checker, scan_results = _get_checker(resolved_path)
         compliance_results = checker.check_compliance(_risk_value(risk_category))
         plan = _get_plan()
         cta_included = plan not in ("pro", "paid_scan", "marketplace", "certified")
@@ -3865,7 +4604,7 @@ def create_server():
             for p in [project / filename, project / "docs" / filename]:
                 if p.exists():
                     try:
-                        return p.read_text(encoding="utf-8", errors="ignore")
+                        return p.read_bytes().decode("utf-8", errors="ignore")
                     except OSError:
                         pass
             return f"[NOT FOUND — create {filename} using generate_compliance_templates]"
@@ -4314,7 +5053,7 @@ def create_server():
             entry["file"]: entry["categories"] for entry in gdpr_scan.get("flagged_files", [])
         }
 
-        dual_flagged = sorted(set(ai_file_map.keys()) & set(gdpr_file_map.keys()))
+        dual_flagged = sorted(ai_file_map.keys() & gdpr_file_map.keys())
 
         dual_compliance_flags = []
         for file in dual_flagged:
@@ -4448,11 +5187,22 @@ class MCPServer:
 
     def __init__(self):
         self._tools = {
-            "scan_project": lambda **params: {"tool": "scan_project", "results": EUAIActChecker(params["project_path"]).scan_project()},
-            "check_compliance": lambda **params: {"tool": "check_compliance", "results": (lambda c: (c.scan_project(), c.check_compliance(params.get("risk_category", "limited")))[-1])(EUAIActChecker(params["project_path"]))},
-            "generate_report": lambda **params: {"tool": "generate_report", "results": (lambda c: c.generate_report(c.scan_project(), c.check_compliance(params.get("risk_category", "limited"))))(EUAIActChecker(params["project_path"]))},
-            "suggest_risk_category": lambda **params: self._suggest_risk_category(params["system_description"]),
-            "generate_compliance_templates": lambda **params: self._generate_compliance_templates(params.get("risk_category", "high")),
+            # Project tools share _get_checker's cache: scan -> compliance -> report
+            # on an unchanged project scans it once.
+            "scan_project": lambda project_path, **_: {"tool": "scan_project", "results": _get_checker(project_path)[1]},
+            "check_compliance": lambda project_path, risk_category="limited", **_: {"tool": "check_compliance", "results": _get_checker(project_path)[0].check_compliance(risk_category)},
+            "generate_report": lambda project_path, risk_category="limited", **_: {"tool": "generate_report", "results": (lambda c, scan: c.generate_report(scan, c.check_compliance(risk_category)))(*_get_checker(project_path))},
+            "suggest_risk_category": lambda system_description, **_: self._suggest_risk_category(system_description),
+            "generate_compliance_templates": lambda risk_category="high", **_: self._generate_compliance_templates(risk_category),
+        }
+        # Parameters without a default in each tool's signature; checked up
+        # front so a missing one is reported without raising inside the tool.
+        self._required_params = {
+            name: tuple(
+                p.name for p in inspect.signature(tool).parameters.values()
+                if p.default is p.empty and p.kind is p.POSITIONAL_OR_KEYWORD
+            )
+            for name, tool in self._tools.items()
         }
 
     def _suggest_risk_category(self, system_description: str) -> Dict[str, Any]:
@@ -4485,6 +5235,9 @@ class MCPServer:
     def handle_request(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         if tool_name not in self._tools:
             return {"error": f"Unknown tool: {tool_name}", "available_tools": list(self._tools.keys())}
+        missing = [name for name in self._required_params.get(tool_name, ()) if name not in params]
+        if missing:
+            return {"error": f"Error executing {tool_name}: missing required parameter(s): {', '.join(missing)}"}
         try:
             return self._tools[tool_name](**params)
         except Exception as e:
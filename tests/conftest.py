@@ -1,13 +1,26 @@
 """Shared fixtures for MCP EU AI Act test suite."""
 
-import pytest
-from pathlib import Path
-import sys
+import itertools
+from typing import Dict
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
+# Importing server here (once per pytest process / xdist worker) pays the mcp +
+# pattern-table import cost at conftest load; test modules' own
+# `from server import ...` lines then resolve from sys.modules.
 import server as server_module
 from server import RateLimiter, _current_plan
+from tests.helpers import write_project
+
+
+@pytest.fixture
+def make_project(tmp_path):
+    """Factory: write_project into a fresh numbered directory under tmp_path; returns its path as str."""
+    count = itertools.count()
+
+    def _make(files: Dict[str, bytes]) -> str:
+        return str(write_project(tmp_path / f"project{next(count)}", files))
+    return _make
 
 
 @pytest.fixture(autouse=True)
@@ -37,6 +50,13 @@ def isolate_tool_call_log(tmp_path):
     server_module._TOOL_CALL_LOG_PATH = original_path
 
 
+@pytest.fixture(autouse=True)
+def clear_checker_cache():
+    """Start each test without scans cached by an earlier one (see server._get_checker)."""
+    yield
+    server_module._clear_checker_cache()
+
+
 @pytest.fixture(autouse=True)
 def set_certified_plan():
     """Set plan to 'certified' for all tests so paywall gates don't block tool tests.
@@ -0,0 +1,44 @@
+"""Project-building helpers shared by the test modules.
+
+Kept out of conftest.py so test modules can import them as a plain module;
+conftest.py holds only fixtures.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Dict
+
+
+def write_project(root, files: Dict[str, bytes]) -> Path:
+    """Create ``root`` holding {relative name: bytes content}; returns root as a Path.
+
+    The one project builder for the suite: pytest tests use it through the
+    ``make_project`` fixture, unittest-style classes and root-level test
+    modules import it directly.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return root
+
+
+class TempProjectTestCase(unittest.TestCase):
+    """unittest counterpart of ``make_project``: one temp root per class, a fresh
+    ``test_dir`` per test (build projects in it with write_project)."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._root = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root, ignore_errors=True)
+
+    def setUp(self):
+        self.test_dir = str(self._root / self._testMethodName)
+        Path(self.test_dir).mkdir()
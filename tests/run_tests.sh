@@ -33,7 +33,13 @@ echo "=========================================="
 echo -e "${YELLOW}🎯 Running all tests with coverage${NC}"
 echo "=========================================="
 
-if python3 -m pytest tests/ -v --tb=short --cov=. --cov-report=term-missing; then
+# Parallelise across cores when pytest-xdist is installed
+XDIST_ARGS=""
+if python3 -c "import xdist" &> /dev/null; then
+    XDIST_ARGS="-n auto --dist worksteal"
+fi
+
+if python3 -m pytest tests/ -v --tb=short $XDIST_ARGS --cov=. --cov-report=term-missing; then
     echo ""
     echo -e "${GREEN}✅ ALL TESTS PASSED${NC}"
     exit 0
@@ -3,18 +3,14 @@
 Tests the Annex IV ZIP package generation logic via the create_server() tool.
 """
 
-import sys
 import io
 import re
 import zipfile
 import json
-from pathlib import Path
 from datetime import datetime
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from server import create_server, RiskCategory
 
 
@@ -0,0 +1,85 @@
+"""Tests for the Apify actor's fetch and local scan steps."""
+
+import http.client
+import io
+import tarfile
+
+import pytest
+
+import apify_actor
+from apify_actor import _fetch_github_tarball, _scan_checkout
+
+_REPO_URL = "https://github.com/acme/widget"
+
+
+def _tarball(files):
+    """Gzipped tar of ``files`` under the "<repo>-<sha>/" prefix GitHub adds."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(f"widget-abc123/{name}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+class _DroppedConnection(io.BytesIO):
+    """Response body that fails partway through, like a reset socket."""
+
+    def read(self, size=-1):
+        if self.tell() >= 64:
+            raise http.client.IncompleteRead(b"")
+        return super().read(64 if size < 0 else min(size, 64))
+
+
+class TestFetchGithubTarball:
+    def _serve(self, monkeypatch, body):
+        urls = []
+
+        def fake_urlopen(url, timeout=None):
+            urls.append(url)
+            return body
+
+        monkeypatch.setattr(apify_actor.urllib.request, "urlopen", fake_urlopen)
+        return urls
+
+    def test_extracts_working_tree(self, tmp_path, monkeypatch):
+        urls = self._serve(monkeypatch, io.BytesIO(_tarball({
+            "app.py": b"import openai\n",
+            "pkg/util.py": b"x = 1\n",
+            ".git/config": b"[core]\n",
+            "node_modules/lib/index.js": b"require('openai')\n",
+        })))
+        assert _fetch_github_tarball(_REPO_URL + ".git", str(tmp_path))
+        assert urls == ["https://codeload.github.com/acme/widget/tar.gz/HEAD"]
+        files = sorted(str(p.relative_to(tmp_path)) for p in tmp_path.rglob("*") if p.is_file())
+        assert files == ["app.py", "pkg/util.py"]
+
+    def test_non_github_url_not_fetched(self, tmp_path, monkeypatch):
+        urls = self._serve(monkeypatch, io.BytesIO())
+        assert not _fetch_github_tarball("https://gitlab.com/acme/widget", str(tmp_path))
+        assert urls == []
+
+    def test_dropped_connection_falls_back(self, tmp_path, monkeypatch):
+        self._serve(monkeypatch, _DroppedConnection(_tarball({"app.py": bytes(range(256)) * 64})))
+        assert not _fetch_github_tarball(_REPO_URL, str(tmp_path))
+
+    def test_truncated_gzip_falls_back(self, tmp_path, monkeypatch):
+        body = _tarball({"app.py": bytes(range(256)) * 64})
+        self._serve(monkeypatch, io.BytesIO(body[:len(body) // 2]))
+        assert not _fetch_github_tarball(_REPO_URL, str(tmp_path))
+
+
+class TestScanCheckout:
+    def test_scans_local_checkout(self, tmp_path):
+        (tmp_path / "app.py").write_text("import openai\n")
+        result = _scan_checkout(str(tmp_path), "limited")
+        assert "error" not in result
+        assert result["files_scanned"] == 1
+        assert result["frameworks_detected"] == ["openai"]
+        assert "/" in result["compliance_score"]
+        assert isinstance(result["recommendations"], list)
+
+    def test_invalid_risk_category_returns_error(self, tmp_path):
+        (tmp_path / "app.py").write_text("print('hi')\n")
+        assert "error" in _scan_checkout(str(tmp_path), "super_high")
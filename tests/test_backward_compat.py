@@ -5,13 +5,10 @@ what new features are added. All tests should pass on both v1 and v2.
 """
 
 import re
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from server import EUAIActChecker, create_server
 
 
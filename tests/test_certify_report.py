@@ -4,15 +4,11 @@ Tests the certification logic including key validation and network error handlin
 """
 
 import json
-import sys
 import urllib.error
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from server import create_server
 
 
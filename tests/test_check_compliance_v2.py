@@ -5,13 +5,10 @@ to implement content scoring (v2). Do not modify these tests to make them pass 
 implement the feature in server.py instead.
 """
 
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from server import EUAIActChecker
 
 
@@ -1,14 +1,11 @@
 """Tests for the CLI entry point (eu-ai-act-scanner)."""
 
 import json
-import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from cli import main, _resolve_version
 
 
@@ -5,13 +5,9 @@ Covers: _compute_combined_requirements, _generate_combined_insight,
         gating of recommendations in combined report.
 """
 
-import sys
 import pytest
-from pathlib import Path
 from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from server import (
     _compute_combined_requirements,
     _generate_combined_insight,
@@ -26,6 +22,11 @@ from server import (
 # _compute_combined_requirements
 # ============================================================
 
+def _has(requirements, needle):
+    """True if any requirement line contains needle (one substring search over the joined lines)."""
+    return needle in "\n".join(requirements)
+
+
 class TestComputeCombinedRequirements:
     def test_pii_high_risk_is_critical(self):
         result = _compute_combined_requirements(["openai"], ["pii_fields"], "high")
@@ -62,7 +63,7 @@ class TestComputeCombinedRequirements:
     def test_cookies_generates_requirement(self):
         result = _compute_combined_requirements(["openai"], ["cookie_operations"], "limited")
         assert "ai_cookie_tracking" in result["overlap_type"]
-        assert any("ePrivacy" in r for r in result["requirements"])
+        assert _has(result["requirements"], "ePrivacy")
 
     def test_no_specific_overlap_returns_default(self):
         result = _compute_combined_requirements(["openai"], ["consent_mechanism"], "limited")
@@ -71,19 +72,19 @@ class TestComputeCombinedRequirements:
 
     def test_pii_includes_dpia_requirement(self):
         result = _compute_combined_requirements(["openai"], ["pii_fields"], "high")
-        assert any("DPIA" in r for r in result["requirements"])
+        assert _has(result["requirements"], "DPIA")
 
     def test_pii_includes_art11_requirement(self):
         result = _compute_combined_requirements(["openai"], ["pii_fields"], "limited")
-        assert any("Art. 11" in r for r in result["requirements"])
+        assert _has(result["requirements"], "Art. 11")
 
     def test_tracking_includes_art22_requirement(self):
         result = _compute_combined_requirements(["openai"], ["user_tracking"], "limited")
-        assert any("Art. 22" in r for r in result["requirements"])
+        assert _has(result["requirements"], "Art. 22")
 
     def test_high_risk_pii_adds_human_oversight(self):
         result = _compute_combined_requirements(["openai"], ["pii_fields"], "high")
-        assert any("Art. 14" in r for r in result["requirements"])
+        assert _has(result["requirements"], "Art. 14")
 
     def test_multiple_gdpr_categories(self):
         result = _compute_combined_requirements(
@@ -99,6 +100,13 @@ class TestComputeCombinedRequirements:
         result = _compute_combined_requirements(["openai"], ["pii_fields"], "limited")
         assert all(isinstance(r, str) and len(r) > 0 for r in result["requirements"])
 
+    def test_cached_result_not_shared_between_callers(self):
+        first = _compute_combined_requirements(["openai"], ["pii_fields"], "limited")
+        first["requirements"].append("mutated")
+        second = _compute_combined_requirements(("anthropic",), ("pii_fields",), "limited")
+        assert "mutated" not in second["requirements"]
+        assert second == _compute_combined_requirements(["openai"], ["pii_fields"], "limited")
+
 
 # ============================================================
 # _generate_combined_insight
@@ -159,62 +167,61 @@ class TestGenerateCombinedInsight:
 # combined_compliance_report — end-to-end via EUAIActChecker + GDPRChecker
 # ============================================================
 
+_INTEGRATION_PROJECTS = {
+    "pii": {"app.py": "import openai\nclient = openai.OpenAI()\nemail = user.email\nfirst_name = user.first_name\n"},
+    "no_pii": {"app.py": "import openai\nclient = openai.OpenAI()\n"},
+    "no_ai": {"app.py": "email = user.email\nfirst_name = user.first_name\n"},
+    "tracking": {"tracking.py": "import anthropic\nclient = anthropic.Anthropic()\nanalytics.track(user_id, 'page_view')\n"},
+    "langchain_pii": {"app.py": "from langchain.llms import OpenAI\nllm = OpenAI()\nemail = user.email\n"},
+}
+
+
+def _by_file(entries, field):
+    """Map scanner entries ({"file": ..., field: [...]}) to {file: field value}."""
+    return {e["file"]: e[field] for e in entries}
+
+
+@pytest.fixture(scope="class")
+def scan_maps(tmp_path_factory):
+    """Scan every project in _INTEGRATION_PROJECTS once: name -> (ai_map, gdpr_map)."""
+    maps = {}
+    for name, files in _INTEGRATION_PROJECTS.items():
+        root = tmp_path_factory.mktemp(name)
+        for filename, content in files.items():
+            (root / filename).write_text(content)
+        eu_scan = EUAIActChecker(str(root)).scan_project()
+        gdpr_scan = GDPRChecker(str(root)).scan_project()
+        maps[name] = (
+            _by_file(eu_scan.get("ai_files", []), "frameworks"),
+            _by_file(gdpr_scan.get("flagged_files", []), "categories"),
+        )
+    return maps
+
+
 class TestCombinedComplianceReportIntegration:
     """Tests the full correlation logic using real scanner outputs on tmp projects."""
 
-    def test_dual_flagged_file_detected(self, tmp_path):
-        (tmp_path / "app.py").write_text(
-            "import openai\nclient = openai.OpenAI()\nemail = user.email\nfirst_name = user.first_name\n"
-        )
-        eu = EUAIActChecker(str(tmp_path))
-        eu_scan = eu.scan_project()
-        gdpr = GDPRChecker(str(tmp_path))
-        gdpr_scan = gdpr.scan_project()
-
-        ai_map = {e["file"]: e["frameworks"] for e in eu_scan.get("ai_files", [])}
-        gdpr_map = {e["file"]: e["categories"] for e in gdpr_scan.get("flagged_files", [])}
-        overlap = set(ai_map.keys()) & set(gdpr_map.keys())
+    def test_dual_flagged_file_detected(self, scan_maps):
+        ai_map, gdpr_map = scan_maps["pii"]
+        overlap = ai_map.keys() & gdpr_map.keys()
 
         assert "app.py" in overlap
 
-    def test_no_overlap_when_no_pii(self, tmp_path):
-        (tmp_path / "app.py").write_text("import openai\nclient = openai.OpenAI()\n")
-        eu = EUAIActChecker(str(tmp_path))
-        eu_scan = eu.scan_project()
-        gdpr = GDPRChecker(str(tmp_path))
-        gdpr_scan = gdpr.scan_project()
-
-        ai_map = {e["file"]: e["frameworks"] for e in eu_scan.get("ai_files", [])}
-        gdpr_map = {e["file"]: e["categories"] for e in gdpr_scan.get("flagged_files", [])}
-        overlap = set(ai_map.keys()) & set(gdpr_map.keys())
+    def test_no_overlap_when_no_pii(self, scan_maps):
+        ai_map, gdpr_map = scan_maps["no_pii"]
+        overlap = ai_map.keys() & gdpr_map.keys()
 
         assert len(overlap) == 0
 
-    def test_no_overlap_when_no_ai(self, tmp_path):
-        (tmp_path / "app.py").write_text("email = user.email\nfirst_name = user.first_name\n")
-        eu = EUAIActChecker(str(tmp_path))
-        eu_scan = eu.scan_project()
-        gdpr = GDPRChecker(str(tmp_path))
-        gdpr_scan = gdpr.scan_project()
-
-        ai_map = {e["file"]: e["frameworks"] for e in eu_scan.get("ai_files", [])}
-        gdpr_map = {e["file"]: e["categories"] for e in gdpr_scan.get("flagged_files", [])}
-        overlap = set(ai_map.keys()) & set(gdpr_map.keys())
+    def test_no_overlap_when_no_ai(self, scan_maps):
+        ai_map, gdpr_map = scan_maps["no_ai"]
+        overlap = ai_map.keys() & gdpr_map.keys()
 
         assert len(overlap) == 0
 
-    def test_overlap_with_tracking(self, tmp_path):
-        (tmp_path / "tracking.py").write_text(
-            "import anthropic\nclient = anthropic.Anthropic()\nanalytics.track(user_id, 'page_view')\n"
-        )
-        eu = EUAIActChecker(str(tmp_path))
-        eu_scan = eu.scan_project()
-        gdpr = GDPRChecker(str(tmp_path))
-        gdpr_scan = gdpr.scan_project()
-
-        ai_map = {e["file"]: e["frameworks"] for e in eu_scan.get("ai_files", [])}
-        gdpr_map = {e["file"]: e["categories"] for e in gdpr_scan.get("flagged_files", [])}
-        overlap = set(ai_map.keys()) & set(gdpr_map.keys())
+    def test_overlap_with_tracking(self, scan_maps):
+        ai_map, gdpr_map = scan_maps["tracking"]
+        overlap = ai_map.keys() & gdpr_map.keys()
 
         assert "tracking.py" in overlap
         combined = _compute_combined_requirements(
@@ -222,18 +229,9 @@ class TestCombinedComplianceReportIntegration:
         )
         assert "ai_automated_tracking" in combined["overlap_type"]
 
-    def test_combined_requirements_structure(self, tmp_path):
-        (tmp_path / "app.py").write_text(
-            "from langchain.llms import OpenAI\nllm = OpenAI()\nemail = user.email\n"
-        )
-        eu = EUAIActChecker(str(tmp_path))
-        eu_scan = eu.scan_project()
-        gdpr = GDPRChecker(str(tmp_path))
-        gdpr_scan = gdpr.scan_project()
-
-        ai_map = {e["file"]: e["frameworks"] for e in eu_scan.get("ai_files", [])}
-        gdpr_map = {e["file"]: e["categories"] for e in gdpr_scan.get("flagged_files", [])}
-        overlap = set(ai_map.keys()) & set(gdpr_map.keys())
+    def test_combined_requirements_structure(self, scan_maps):
+        ai_map, gdpr_map = scan_maps["langchain_pii"]
+        overlap = ai_map.keys() & gdpr_map.keys()
 
         assert "app.py" in overlap
         combined = _compute_combined_requirements(
@@ -5,14 +5,11 @@ as exposed through direct calls to the server module.
 """
 
 import json
-import sys
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from server import EUAIActChecker, create_server, RiskCategory
 
 
@@ -1,13 +1,9 @@
 """Tests for CTA variant selection, _make_result_dict, and _format_text_result."""
 
-import sys
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import server
 
 
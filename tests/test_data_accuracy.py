@@ -5,24 +5,108 @@ Verifies correctness of risk categories, requirements, and detection patterns
 """
 
 import unittest
-import sys
 import re
-from pathlib import Path
 
-# Add parent directory to path for import
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
+import server
 from server import AI_MODEL_PATTERNS, RISK_CATEGORIES
 
 
-class TestAIModelPatterns(unittest.TestCase):
-    """AI detection pattern accuracy tests"""
-
-    def test_openai_patterns_accuracy(self):
-        """Test OpenAI patterns against real code"""
-        patterns = AI_MODEL_PATTERNS["openai"]
-
-        valid_openai_code = [
+def _detected(code):
+    """Frameworks the scanner reports for ``code``, through the production matcher."""
+    return set(server._detect_frameworks(
+        code, server._AI_PATTERNS_COMPILED, server._AI_PATTERN_LITERALS,
+        server._AI_PATTERNS_HS, server._AI_LITERALS_AC, server._AI_PATTERNS_FUSED,
+    ))
+
+
+def _shortest_match(pattern):
+    """Shortest text matching ``pattern`` (optional parts dropped), or None if unsupported."""
+    from re import _constants as c, _parser
+
+    def gen(items):
+        out = []
+        for op, arg in items:
+            if op is c.LITERAL:
+                out.append(chr(arg))
+            elif op is c.NOT_LITERAL:
+                out.append("x" if chr(arg) != "x" else "y")
+            elif op is c.ANY:
+                out.append("x")
+            elif op is c.AT:
+                continue
+            elif op is c.IN:
+                kind, val = arg[0]
+                if kind is c.LITERAL or kind is c.RANGE:
+                    out.append(chr(val if kind is c.LITERAL else val[0]))
+                elif kind is c.CATEGORY:
+                    out.append({c.CATEGORY_DIGIT: "0", c.CATEGORY_SPACE: " "}.get(val, "a"))
+                else:
+                    return None
+            elif op in (c.MAX_REPEAT, c.MIN_REPEAT):
+                body = gen(arg[2])
+                if body is None:
+                    return None
+                out.append(body * arg[0])
+            elif op is c.SUBPATTERN:
+                body = gen(arg[3])
+                if body is None:
+                    return None
+                out.append(body)
+            elif op is c.BRANCH:
+                body = gen(arg[1][0])
+                if body is None:
+                    return None
+                out.append(body)
+            else:
+                return None
+        return "".join(out)
+
+    return gen(_parser.parse(pattern))
+
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+_MEANINGFUL_KEYWORDS = (
+    "documentation", "system", "data", "transparency", "oversight",
+    "quality", "no specific", "voluntary", "prohibited", "robustness",
+    "accuracy", "cybersecurity", "human", "management", "risk",
+    "governance", "registration", "information", "user", "marking",
+    "content", "obligations", "deploy", "encouraged", "code",
+)
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _MEANINGFUL_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_kw, _kw)
+    _KEYWORD_AUTOMATON.make_automaton()
+    _KEYWORD_RE = None
+else:
+    _KEYWORD_AUTOMATON = None
+    _KEYWORD_RE = re.compile("|".join(map(re.escape, _MEANINGFUL_KEYWORDS)))
+
+
+def _has_meaningful_keyword(text_lc):
+    """True if lowercased ``text_lc`` contains any of _MEANINGFUL_KEYWORDS, in one pass."""
+    if _KEYWORD_AUTOMATON is not None:
+        return next(_KEYWORD_AUTOMATON.iter(text_lc), None) is not None
+    return _KEYWORD_RE.search(text_lc) is not None
+
+
+# Lowercased descriptions / joined requirements, built once for the keyword checks.
+_DESC_LC = {name: cat["description"].lower() for name, cat in RISK_CATEGORIES.items()}
+_REQ_LC = {name: " ".join(cat["requirements"]).lower() for name, cat in RISK_CATEGORIES.items()}
+
+
+# framework -> (snippets that must be detected, snippets that must not be)
+_ACCURACY_CASES = {
+    "openai": (
+        [
             "import openai",
             "from openai import OpenAI",
             "openai.ChatCompletion.create()",
@@ -30,114 +114,103 @@ class TestAIModelPatterns(unittest.TestCase):
             'model="gpt-4"',
             'model="gpt-3.5-turbo"',
             'engine="text-davinci-003"',
-        ]
-
-        for code in valid_openai_code:
-            matched = any(re.search(pattern, code, re.IGNORECASE) for pattern in patterns)
-            self.assertTrue(matched, f"Failed to detect OpenAI in: {code}")
-
-        invalid_code = [
+        ],
+        [
             "import os",
             "from anthropic import Anthropic",
             "import tensorflow",
-        ]
-
-        for code in invalid_code:
-            matched = any(re.search(pattern, code, re.IGNORECASE) for pattern in patterns)
-            self.assertFalse(matched, f"False positive for OpenAI in: {code}")
-
-    def test_anthropic_patterns_accuracy(self):
-        """Test Anthropic patterns against real code"""
-        patterns = AI_MODEL_PATTERNS["anthropic"]
-
-        valid_anthropic_code = [
+        ],
+    ),
+    "anthropic": (
+        [
             "from anthropic import Anthropic",
             "import anthropic",
             'model="claude-3-opus-20240229"',
             'model="claude-3-sonnet-20240229"',
             "client = Anthropic()",
             "client.messages.create()",
-        ]
-
-        for code in valid_anthropic_code:
-            matched = any(re.search(pattern, code, re.IGNORECASE) for pattern in patterns)
-            self.assertTrue(matched, f"Failed to detect Anthropic in: {code}")
-
-    def test_huggingface_patterns_accuracy(self):
-        """Test HuggingFace patterns against real code"""
-        patterns = AI_MODEL_PATTERNS["huggingface"]
-
-        valid_hf_code = [
+        ],
+        [],
+    ),
+    "huggingface": (
+        [
             "from transformers import AutoModel",
             "from transformers import AutoTokenizer",
             "from transformers import pipeline",
             "model = AutoModel.from_pretrained('bert-base-uncased')",
             "from huggingface_hub import HfApi",
-        ]
-
-        for code in valid_hf_code:
-            matched = any(re.search(pattern, code, re.IGNORECASE) for pattern in patterns)
-            self.assertTrue(matched, f"Failed to detect HuggingFace in: {code}")
-
-    def test_tensorflow_patterns_accuracy(self):
-        """Test TensorFlow patterns against real code"""
-        patterns = AI_MODEL_PATTERNS["tensorflow"]
-
-        valid_tf_code = [
+        ],
+        [],
+    ),
+    "tensorflow": (
+        [
             "import tensorflow as tf",
             "from tensorflow import keras",
             "model = tf.keras.Sequential()",
-        ]
-
-        for code in valid_tf_code:
-            matched = any(re.search(pattern, code, re.IGNORECASE) for pattern in patterns)
-            self.assertTrue(matched, f"Failed to detect TensorFlow in: {code}")
-
-        self.assertTrue("model.h5".endswith(".h5"))
-        h5_pattern = r"\.h5$"
-        self.assertTrue(re.search(h5_pattern, "model.h5"))
-
-    def test_pytorch_patterns_accuracy(self):
-        """Test PyTorch patterns against real code"""
-        patterns = AI_MODEL_PATTERNS["pytorch"]
-
-        valid_pytorch_code = [
+            "model.h5",
+        ],
+        [],
+    ),
+    "pytorch": (
+        [
             "import torch",
             "from torch import nn",
             "class MyModel(nn.Module):",
-        ]
-
-        for code in valid_pytorch_code:
-            matched = any(re.search(pattern, code, re.IGNORECASE) for pattern in patterns)
-            self.assertTrue(matched, f"Failed to detect PyTorch in: {code}")
-
-        self.assertTrue("model.pt".endswith(".pt"))
-        self.assertTrue("model.pth".endswith(".pth"))
-        pt_pattern = r"\.pt$"
-        pth_pattern = r"\.pth$"
-        self.assertTrue(re.search(pt_pattern, "model.pt"))
-        self.assertTrue(re.search(pth_pattern, "model.pth"))
-
-    def test_langchain_patterns_accuracy(self):
-        """Test LangChain patterns against real code"""
-        patterns = AI_MODEL_PATTERNS["langchain"]
-
-        valid_langchain_code = [
+            "model.pt",
+            "model.pth",
+        ],
+        [],
+    ),
+    "langchain": (
+        [
             "from langchain import LLMChain",
             "from langchain.llms import ChatOpenAI",
             "import langchain",
-        ]
+        ],
+        [],
+    ),
+}
+
+
+@pytest.mark.parametrize("framework", list(_ACCURACY_CASES))
+def test_framework_patterns_accuracy(framework):
+    """Test each framework's patterns against real code"""
+    valid, invalid = _ACCURACY_CASES[framework]
+    for code in valid:
+        assert framework in _detected(code), f"Failed to detect {framework} in: {code}"
+    for code in invalid:
+        assert framework not in _detected(code), f"False positive for {framework} in: {code}"
+
+
+@pytest.mark.parametrize("table, compiled, literals", [
+    (server.AI_MODEL_PATTERNS, server._AI_PATTERNS_COMPILED, server._AI_PATTERN_LITERALS),
+    (server.CONFIG_DEPENDENCY_PATTERNS, server._CONFIG_PATTERNS_COMPILED, server._CONFIG_PATTERN_LITERALS),
+], ids=["code", "config"])
+def test_fused_named_group_pattern_agrees(table, compiled, literals):
+    """The fused alternation (used under re2) detects exactly what per-pattern search does."""
+    fused = re.compile(server._fused_scan_source(table))
+    for valid, invalid in _ACCURACY_CASES.values():
+        for code in valid + invalid:
+            expected = server._detect_frameworks(code, compiled, literals)
+            assert server._detect_frameworks(code, compiled, literals, fused=fused) == expected, code
+
+
+@pytest.mark.parametrize("pattern, plain", [
+    ("import openai", "import openai"),
+    (r"Anthropic\(\)", "anthropic()"),
+    (r"gpt-3\.5", "gpt-3.5"),
+    (r"\bopenai\s*[>=<~!]", None),
+    ("claude.*opus", None),
+])
+def test_plain_pattern_partition(pattern, plain):
+    assert server._plain_pattern(pattern) == plain
+
 
-        for code in valid_langchain_code:
-            matched = any(re.search(pattern, code, re.IGNORECASE) for pattern in patterns)
-            self.assertTrue(matched, f"Failed to detect LangChain in: {code}")
+class TestAIModelPatterns(unittest.TestCase):
+    """AI detection pattern accuracy tests"""
 
     def test_no_false_positives(self):
         """Test no false positives with normal code"""
-        all_patterns = []
-        for patterns in AI_MODEL_PATTERNS.values():
-            all_patterns.extend(patterns)
-
         normal_code = [
             "import os",
             "import sys",
@@ -147,9 +220,9 @@ class TestAIModelPatterns(unittest.TestCase):
             "class MyClass: pass",
         ]
 
+        # Each snippet on its own, so ^/$ anchors see the snippet boundaries
         for code in normal_code:
-            matched = any(re.search(pattern, code, re.IGNORECASE) for pattern in all_patterns)
-            self.assertFalse(matched, f"False positive in: {code}")
+            self.assertEqual(_detected(code), set(), f"False positive in {code!r}")
 
     def test_all_frameworks_have_patterns(self):
         """Test all frameworks have at least one pattern"""
@@ -158,7 +231,7 @@ class TestAIModelPatterns(unittest.TestCase):
         for framework in expected_frameworks:
             self.assertIn(framework, AI_MODEL_PATTERNS)
             self.assertGreater(len(AI_MODEL_PATTERNS[framework]), 0)
-            self.assertIsInstance(AI_MODEL_PATTERNS[framework], list)
+            self.assertIsInstance(AI_MODEL_PATTERNS[framework], (list, tuple))
 
 
 class TestRiskCategories(unittest.TestCase):
@@ -178,14 +251,14 @@ class TestRiskCategories(unittest.TestCase):
         self.assertIn("description", category)
         self.assertIn("requirements", category)
 
-        description_lower = category["description"].lower()
+        description_lower = _DESC_LC["unacceptable"]
         self.assertTrue(
             "prohibited" in description_lower or "manipulation" in description_lower,
             "Description should mention prohibited systems"
         )
 
         self.assertGreater(len(category["requirements"]), 0)
-        self.assertIsInstance(category["requirements"], list)
+        self.assertIsInstance(category["requirements"], (list, tuple))
 
     def test_high_risk_category(self):
         """Test high risk category"""
@@ -194,13 +267,13 @@ class TestRiskCategories(unittest.TestCase):
         self.assertIn("description", category)
         self.assertIn("requirements", category)
 
-        description_lower = category["description"].lower()
+        description_lower = _DESC_LC["high"]
         self.assertTrue(
             "high-risk" in description_lower or "recruitment" in description_lower or "credit" in description_lower,
             "Description should mention high-risk systems"
         )
 
-        requirements_str = " ".join(category["requirements"]).lower()
+        requirements_str = _REQ_LC["high"]
 
         required_keywords = [
             "documentation",
@@ -210,11 +283,8 @@ class TestRiskCategories(unittest.TestCase):
             "robustness",
         ]
 
-        for keyword in required_keywords:
-            self.assertTrue(
-                keyword in requirements_str,
-                f"High-risk requirements should include '{keyword}'"
-            )
+        missing = [k for k in required_keywords if k not in requirements_str]
+        self.assertEqual(missing, [], f"High-risk requirements should include {missing}")
 
         self.assertGreaterEqual(len(category["requirements"]), 6)
 
@@ -225,24 +295,21 @@ class TestRiskCategories(unittest.TestCase):
         self.assertIn("description", category)
         self.assertIn("requirements", category)
 
-        description_lower = category["description"].lower()
+        description_lower = _DESC_LC["limited"]
         self.assertTrue(
             "limited" in description_lower or "chatbot" in description_lower,
             "Description should mention limited-risk systems"
         )
 
-        requirements_str = " ".join(category["requirements"]).lower()
+        requirements_str = _REQ_LC["limited"]
 
         required_keywords = [
             "transparency",
             "information",
         ]
 
-        for keyword in required_keywords:
-            self.assertTrue(
-                keyword in requirements_str,
-                f"Limited-risk requirements should include '{keyword}'"
-            )
+        missing = [k for k in required_keywords if k not in requirements_str]
+        self.assertEqual(missing, [], f"Limited-risk requirements should include {missing}")
 
         self.assertGreaterEqual(len(category["requirements"]), 2)
 
@@ -253,13 +320,13 @@ class TestRiskCategories(unittest.TestCase):
         self.assertIn("description", category)
         self.assertIn("requirements", category)
 
-        description_lower = category["description"].lower()
+        description_lower = _DESC_LC["minimal"]
         self.assertTrue(
             "minimal" in description_lower or "spam" in description_lower or "game" in description_lower,
             "Description should mention minimal-risk systems"
         )
 
-        requirements_str = " ".join(category["requirements"]).lower()
+        requirements_str = _REQ_LC["minimal"]
         self.assertTrue(
             "no specific" in requirements_str or "voluntary" in requirements_str,
             "Minimal-risk should have minimal or voluntary requirements"
@@ -274,14 +341,9 @@ class TestRiskCategories(unittest.TestCase):
                 self.assertIsInstance(req, str)
                 self.assertGreater(len(req), 5, f"Requirement too short in {category_name}: {req}")
 
+                req_lc = req.lower()
                 self.assertTrue(
-                    any(word in req.lower() for word in [
-                        "documentation", "system", "data", "transparency", "oversight",
-                        "quality", "no specific", "voluntary", "prohibited", "robustness",
-                        "accuracy", "cybersecurity", "human", "management", "risk",
-                        "governance", "registration", "information", "user", "marking",
-                        "content", "obligations", "deploy", "encouraged", "code"
-                    ]),
+                    _has_meaningful_keyword(req_lc),
                     f"Requirement lacks meaningful content in {category_name}: {req}"
                 )
 
@@ -295,20 +357,23 @@ class TestRiskCategories(unittest.TestCase):
         self.assertGreater(limited_reqs, minimal_reqs, "Limited risk should have more requirements than minimal")
 
 
+# (passed, total, expected compliance %)
+_SCORE_CASES = (
+    (3, 3, 100.0),
+    (2, 3, 66.7),
+    (1, 3, 33.3),
+    (0, 3, 0.0),
+    (5, 6, 83.3),
+)
+
+
 class TestComplianceAccuracy(unittest.TestCase):
     """Compliance logic accuracy tests"""
 
     def test_compliance_score_calculation(self):
         """Test compliance score calculation"""
-        test_cases = [
-            (3, 3, 100.0),
-            (2, 3, 66.7),
-            (1, 3, 33.3),
-            (0, 3, 0.0),
-            (5, 6, 83.3),
-        ]
-
-        for passed, total, expected_pct in test_cases:
+        for passed, total, expected_pct in _SCORE_CASES:
+            # Same expression as EUAIActChecker.check_compliance
             calculated_pct = round((passed / total) * 100, 1) if total > 0 else 0
             self.assertEqual(
                 calculated_pct,
@@ -324,7 +389,7 @@ class TestComplianceAccuracy(unittest.TestCase):
             "law enforcement",
         ]
 
-        high_risk_desc = RISK_CATEGORIES["high"]["description"].lower()
+        high_risk_desc = _DESC_LC["high"]
 
         matches = sum(1 for ex in high_risk_examples if ex in high_risk_desc)
         self.assertGreaterEqual(matches, 2, "High-risk description should mention known examples")
@@ -335,7 +400,7 @@ class TestComplianceAccuracy(unittest.TestCase):
             "surveillance",
         ]
 
-        unacceptable_desc = RISK_CATEGORIES["unacceptable"]["description"].lower()
+        unacceptable_desc = _DESC_LC["unacceptable"]
 
         matches = sum(1 for ex in unacceptable_examples if ex in unacceptable_desc)
         self.assertGreaterEqual(matches, 1, "Unacceptable-risk description should mention prohibited systems")
@@ -347,21 +412,46 @@ class TestDataConsistency(unittest.TestCase):
     def test_no_duplicate_patterns(self):
         """Test no duplicate patterns within a framework"""
         for framework, patterns in AI_MODEL_PATTERNS.items():
-            unique_patterns = set(patterns)
             self.assertEqual(
                 len(patterns),
-                len(unique_patterns),
+                len(dict.fromkeys(patterns)),
                 f"Duplicate patterns found in {framework}"
             )
 
     def test_patterns_are_valid_regex(self):
         """Test all patterns are valid regex"""
         for framework, patterns in AI_MODEL_PATTERNS.items():
-            for pattern in patterns:
-                try:
-                    re.compile(pattern)
-                except re.error as e:
-                    self.fail(f"Invalid regex in {framework}: {pattern} - {e}")
+            try:
+                re.compile("|".join(f"(?:{p})" for p in patterns))
+            except re.error:
+                # Only pay per-pattern compiles to name the offender.
+                for pattern in patterns:
+                    try:
+                        re.compile(pattern)
+                    except re.error as e:
+                        self.fail(f"Invalid regex in {framework}: {pattern} - {e}")
+                raise
+
+    def test_literal_prefilter_covers_patterns(self):
+        """Test each pattern's required literal occurs in the shortest text the pattern matches"""
+        for table in (AI_MODEL_PATTERNS, server.CONFIG_DEPENDENCY_PATTERNS):
+            for framework, patterns in table.items():
+                for pattern in patterns:
+                    literal = server._required_literal(pattern)
+                    self.assertIsNotNone(literal, f"No literal prefilter for {pattern}")
+                    text = _shortest_match(pattern)
+                    self.assertIsNotNone(text, f"Cannot build a match for {pattern}")
+                    self.assertTrue(re.search(pattern, text, re.IGNORECASE | re.MULTILINE), pattern)
+                    self.assertIn(literal, text.lower(), f"Prefilter would skip a match of {pattern}")
+
+    def test_literal_prefilter_gives_up_on_optional_parts(self):
+        """Test patterns whose runs may be absent from a match get no literal"""
+        for pattern in (r"gpt(-4)?", r"(turbo)*gpt", r"(claude|gemini)x", r"a{2}bcdef",
+                        r"(?:llama)cpp", r"openai|anthropic"):
+            self.assertIsNone(server._required_literal(pattern), pattern)
+        # Quantifiers on a single character only drop that character
+        self.assertEqual(server._required_literal(r"gpt-?4o"), "gpt")
+        self.assertEqual(server._required_literal(r"x(abcdef)+"), "abcdef")
 
     def test_risk_categories_structure(self):
         """Test all categories have the same structure"""
@@ -376,7 +466,7 @@ class TestDataConsistency(unittest.TestCase):
                 )
 
             self.assertIsInstance(category["description"], str)
-            self.assertIsInstance(category["requirements"], list)
+            self.assertIsInstance(category["requirements"], (list, tuple))
 
     def test_no_empty_data(self):
         """Test no empty data"""
@@ -395,13 +485,14 @@ class TestFrameworkCoverage(unittest.TestCase):
 
     def test_major_frameworks_covered(self):
         """Test major frameworks are covered"""
+        # Expected names are given lowercase so only the joined patterns need lowering.
         major_frameworks = {
-            "openai": ["OpenAI", "GPT"],
-            "anthropic": ["Claude", "Anthropic"],
-            "huggingface": ["Transformers", "HuggingFace"],
-            "tensorflow": ["TensorFlow", "Keras"],
-            "pytorch": ["PyTorch", "Torch"],
-            "langchain": ["LangChain"],
+            "openai": ["openai", "gpt"],
+            "anthropic": ["claude", "anthropic"],
+            "huggingface": ["transformers", "huggingface"],
+            "tensorflow": ["tensorflow", "keras"],
+            "pytorch": ["pytorch", "torch"],
+            "langchain": ["langchain"],
         }
 
         for framework, expected_detections in major_frameworks.items():
@@ -410,7 +501,7 @@ class TestFrameworkCoverage(unittest.TestCase):
 
             patterns_str = " ".join(patterns).lower()
             framework_mentioned = any(
-                name.lower() in patterns_str for name in expected_detections
+                name in patterns_str for name in expected_detections
             )
 
             self.assertTrue(
@@ -441,24 +532,22 @@ class TestEUAIActArticleAccuracy(unittest.TestCase):
 
     def test_article_5_prohibited_practices(self):
         """Art. 5 - Prohibited practices are properly covered"""
-        desc = RISK_CATEGORIES["unacceptable"]["description"].lower()
+        desc = _DESC_LC["unacceptable"]
         prohibited = ["manipulation", "social scoring", "surveillance"]
         covered = sum(1 for p in prohibited if p in desc)
         self.assertGreaterEqual(covered, 2, "Article 5 prohibited practices insufficiently covered")
 
     def test_article_6_high_risk_systems(self):
         """Art. 6 - High-risk systems have Annex III requirements"""
-        high_reqs = RISK_CATEGORIES["high"]["requirements"]
-        req_text = " ".join(high_reqs).lower()
+        req_text = _REQ_LC["high"]
 
         essential = ["documentation", "risk", "data", "transparency", "human oversight", "robustness"]
-        for req in essential:
-            self.assertIn(req, req_text, f"High-risk missing Art. 6 requirement: {req}")
+        missing = [req for req in essential if req not in req_text]
+        self.assertEqual(missing, [], f"High-risk missing Art. 6 requirements: {missing}")
 
     def test_article_52_transparency_obligations(self):
         """Art. 52 - Transparency obligations for limited risk"""
-        limited_reqs = RISK_CATEGORIES["limited"]["requirements"]
-        req_text = " ".join(limited_reqs).lower()
+        req_text = _REQ_LC["limited"]
 
         self.assertIn("transparency", req_text)
         self.assertIn("user", req_text)
@@ -472,25 +561,24 @@ class TestEUAIActArticleAccuracy(unittest.TestCase):
 
     def test_high_risk_examples_accuracy(self):
         """High-risk system examples match Annex III"""
-        desc = RISK_CATEGORIES["high"]["description"].lower()
+        desc = _DESC_LC["high"]
         annex_iii_examples = ["recruitment", "credit", "law"]
         covered = sum(1 for ex in annex_iii_examples if ex in desc)
         self.assertGreaterEqual(covered, 2, "High-risk examples should match Annex III")
 
     def test_limited_risk_examples_accuracy(self):
         """Limited risk examples are correct"""
-        desc = RISK_CATEGORIES["limited"]["description"].lower()
+        desc = _DESC_LC["limited"]
         self.assertTrue("chatbot" in desc or "deepfake" in desc)
 
     def test_minimal_risk_no_mandatory_requirements(self):
         """Minimal risk has no mandatory requirements (Art. 69 - voluntary codes)"""
-        req_text = " ".join(RISK_CATEGORIES["minimal"]["requirements"]).lower()
+        req_text = _REQ_LC["minimal"]
         self.assertTrue("no specific" in req_text or "voluntary" in req_text)
 
     def test_high_risk_eu_database_registration(self):
         """Art. 60 - High-risk systems must be registered in EU database"""
-        high_reqs = RISK_CATEGORIES["high"]["requirements"]
-        req_text = " ".join(high_reqs).lower()
+        req_text = _REQ_LC["high"]
         self.assertTrue("registration" in req_text or "database" in req_text)
 
 
@@ -499,32 +587,18 @@ class TestPatternCrossContamination(unittest.TestCase):
 
     def test_openai_not_detected_as_langchain(self):
         """Pure OpenAI code should not trigger LangChain"""
-        langchain_patterns = AI_MODEL_PATTERNS["langchain"]
         pure_openai_code = "import openai\nopenai.ChatCompletion.create(model='gpt-4')"
-
-        for pattern in langchain_patterns:
-            if pattern == "ChatOpenAI":
-                continue
-            matched = re.search(pattern, pure_openai_code, re.IGNORECASE)
-            self.assertIsNone(matched, f"LangChain pattern '{pattern}' false positive on OpenAI code")
+        self.assertNotIn("langchain", _detected(pure_openai_code), "LangChain false positive on OpenAI code")
 
     def test_pytorch_not_detected_as_tensorflow(self):
         """Pure PyTorch code should not trigger TensorFlow"""
-        tf_patterns = AI_MODEL_PATTERNS["tensorflow"]
         pure_pytorch_code = "import torch\nmodel = torch.nn.Linear(10, 5)"
-
-        for pattern in tf_patterns:
-            matched = re.search(pattern, pure_pytorch_code, re.IGNORECASE)
-            self.assertIsNone(matched, f"TensorFlow pattern '{pattern}' false positive on PyTorch code")
+        self.assertNotIn("tensorflow", _detected(pure_pytorch_code), "TensorFlow false positive on PyTorch code")
 
     def test_anthropic_not_detected_as_openai(self):
         """Pure Anthropic code should not trigger OpenAI"""
-        openai_patterns = AI_MODEL_PATTERNS["openai"]
         pure_anthropic_code = "from anthropic import Anthropic\nclient = Anthropic()\nclient.messages.create(model='claude-3-opus')"
-
-        for pattern in openai_patterns:
-            matched = re.search(pattern, pure_anthropic_code, re.IGNORECASE)
-            self.assertIsNone(matched, f"OpenAI pattern '{pattern}' false positive on Anthropic code")
+        self.assertNotIn("openai", _detected(pure_anthropic_code), "OpenAI false positive on Anthropic code")
 
 
 if __name__ == "__main__":
@@ -6,14 +6,9 @@ Covers: GDPRChecker, pattern detection, compliance checks, templates, reports.
 import os
 import re
 import pytest
-from pathlib import Path
 from unittest.mock import patch
 from datetime import datetime, timezone
 
-# Add parent dir to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from gdpr_module import (
     GDPRChecker,
     GDPR_CONFIG_PATTERNS,
@@ -309,6 +304,15 @@ class TestScanProject:
         assert result["flagged_files"] == []
         assert "processing_summary" in result
 
+    def test_scan_skips_vendored_dirs(self, tmp_project):
+        (tmp_project / "app.py").write_text("print('hello')\n")
+        vendored = tmp_project / "node_modules" / "pkg"
+        vendored.mkdir(parents=True)
+        (vendored / "index.js").write_text("const email = user.email;\n")
+        result = GDPRChecker(str(tmp_project)).scan_project()
+        assert result["files_scanned"] == 1
+        assert result["flagged_files"] == []
+
     def test_scan_detects_pii(self, project_with_pii):
         checker = GDPRChecker(str(project_with_pii))
         result = checker.scan_project()
@@ -6,8 +6,6 @@ Tests complete end-to-end user scenarios
 
 import unittest
 import sys
-import tempfile
-import shutil
 import json
 from pathlib import Path
 
@@ -15,22 +13,19 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from server import MCPServer, EUAIActChecker
+from tests.helpers import TempProjectTestCase
 
 
-class TestEndToEndScenarios(unittest.TestCase):
+class TestEndToEndScenarios(TempProjectTestCase):
     """Complete user scenario tests"""
 
     def setUp(self):
         """Create a test environment"""
+        super().setUp()
         self.server = MCPServer()
-        self.test_dir = tempfile.mkdtemp()
         self.project_path = Path(self.test_dir) / "test_project"
         self.project_path.mkdir()
 
-    def tearDown(self):
-        """Clean up"""
-        shutil.rmtree(self.test_dir)
-
     def test_scenario_simple_chatbot(self):
         """
         Scenario: Simple chatbot using OpenAI
@@ -434,17 +429,13 @@ def predict(): pass
         self.assertGreater(scan_result["results"]["files_scanned"], 0)
 
 
-class TestErrorHandling(unittest.TestCase):
+class TestErrorHandling(TempProjectTestCase):
     """Error handling tests under real conditions"""
 
     def setUp(self):
         """Create a test environment"""
+        super().setUp()
         self.server = MCPServer()
-        self.test_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up"""
-        shutil.rmtree(self.test_dir)
 
     def test_invalid_project_path(self):
         """Test with invalid project path"""
@@ -486,19 +477,15 @@ class TestErrorHandling(unittest.TestCase):
         self.assertEqual(result["tool"], "generate_report")
 
 
-class TestReportGeneration(unittest.TestCase):
+class TestReportGeneration(TempProjectTestCase):
     """Detailed report generation tests"""
 
     def setUp(self):
         """Create a test environment"""
-        self.test_dir = tempfile.mkdtemp()
+        super().setUp()
         self.project_path = Path(self.test_dir) / "test_project"
         self.project_path.mkdir()
 
-    def tearDown(self):
-        """Clean up"""
-        shutil.rmtree(self.test_dir)
-
     def test_report_structure_completeness(self):
         """Test complete report structure"""
         (self.project_path / "main.py").write_text("import openai")
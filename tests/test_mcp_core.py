@@ -7,16 +7,11 @@ Plus error handling for invalid inputs.
 Task #1248 — QG dimension: Testing
 """
 
-import sys
 import tempfile
 import shutil
-from pathlib import Path
 
 import pytest
 
-# Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from server import (
     EUAIActChecker,
     MCPServer,
@@ -26,6 +21,7 @@ from server import (
     COMPLIANCE_TEMPLATES,
     _validate_project_path,
 )
+from tests.helpers import write_project
 
 
 # ── Fixtures ──────────────────────────────────────────────
@@ -39,32 +35,47 @@ def tmp_project(tmp_path):
     return project
 
 
+# Sample files using multiple AI frameworks
+_AI_PROJECT_FILES = {
+    "main.py": (
+        b"import openai\n"
+        b"from anthropic import Anthropic\n"
+        b"client = Anthropic()\n"
+        b"response = openai.ChatCompletion.create(model='gpt-4')\n"
+    ),
+    "ml.py": (
+        b"from transformers import AutoModel\n"
+        b"import torch\n"
+        b"model = AutoModel.from_pretrained('bert-base')\n"
+    ),
+    "requirements.txt": (
+        b"openai>=1.0.0\n"
+        b"anthropic>=0.18.0\n"
+        b"transformers>=4.30.0\n"
+        b"torch>=2.0.0\n"
+        b"langchain>=0.1.0\n"
+    ),
+    "README.md": (
+        b"# Sample AI Project\n\n"
+        b"This project uses AI and machine learning for NLP tasks.\n"
+    ),
+}
+
+
 @pytest.fixture
 def ai_project(tmp_project):
     """Create a sample project with multiple AI frameworks."""
-    (tmp_project / "main.py").write_text(
-        "import openai\n"
-        "from anthropic import Anthropic\n"
-        "client = Anthropic()\n"
-        "response = openai.ChatCompletion.create(model='gpt-4')\n"
-    )
-    (tmp_project / "ml.py").write_text(
-        "from transformers import AutoModel\n"
-        "import torch\n"
-        "model = AutoModel.from_pretrained('bert-base')\n"
-    )
-    (tmp_project / "requirements.txt").write_text(
-        "openai>=1.0.0\n"
-        "anthropic>=0.18.0\n"
-        "transformers>=4.30.0\n"
-        "torch>=2.0.0\n"
-        "langchain>=0.1.0\n"
-    )
-    (tmp_project / "README.md").write_text(
-        "# Sample AI Project\n\n"
-        "This project uses AI and machine learning for NLP tasks.\n"
-    )
-    return tmp_project
+    return write_project(tmp_project, _AI_PROJECT_FILES)
+
+
+@pytest.fixture(scope="class")
+def scanned_ai_project(tmp_path_factory):
+    """(checker, scan results) for one sample AI project, scanned once per test class.
+
+    Shared across the class, so tests must only read from it.
+    """
+    checker = EUAIActChecker(str(write_project(tmp_path_factory.mktemp("ai_project"), _AI_PROJECT_FILES)))
+    return checker, checker.scan_project()
 
 
 @pytest.fixture
@@ -81,34 +92,28 @@ def mcp_server():
 class TestScanProject:
     """Tests for scan_project: detects AI frameworks in code and config."""
 
-    def test_detects_openai_in_source(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        results = checker.scan_project()
+    def test_detects_openai_in_source(self, scanned_ai_project):
+        _, results = scanned_ai_project
         assert "openai" in results["detected_models"]
 
-    def test_detects_anthropic_in_source(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        results = checker.scan_project()
+    def test_detects_anthropic_in_source(self, scanned_ai_project):
+        _, results = scanned_ai_project
         assert "anthropic" in results["detected_models"]
 
-    def test_detects_huggingface_in_source(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        results = checker.scan_project()
+    def test_detects_huggingface_in_source(self, scanned_ai_project):
+        _, results = scanned_ai_project
         assert "huggingface" in results["detected_models"]
 
-    def test_detects_pytorch_in_source(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        results = checker.scan_project()
+    def test_detects_pytorch_in_source(self, scanned_ai_project):
+        _, results = scanned_ai_project
         assert "pytorch" in results["detected_models"]
 
-    def test_detects_langchain_in_config(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        results = checker.scan_project()
+    def test_detects_langchain_in_config(self, scanned_ai_project):
+        _, results = scanned_ai_project
         assert "langchain" in results["detected_models"]
 
-    def test_scan_returns_correct_structure(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        results = checker.scan_project()
+    def test_scan_returns_correct_structure(self, scanned_ai_project):
+        _, results = scanned_ai_project
         assert "files_scanned" in results
         assert "ai_files" in results
         assert "detected_models" in results
@@ -116,9 +121,8 @@ class TestScanProject:
         assert isinstance(results["ai_files"], list)
         assert isinstance(results["detected_models"], dict)
 
-    def test_scan_counts_files_correctly(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        results = checker.scan_project()
+    def test_scan_counts_files_correctly(self, scanned_ai_project):
+        _, results = scanned_ai_project
         # main.py + ml.py + requirements.txt = 3 files scanned
         assert results["files_scanned"] >= 3
 
@@ -129,9 +133,8 @@ class TestScanProject:
         assert results["detected_models"] == {}
         assert results["ai_files"] == []
 
-    def test_scan_ai_files_have_framework_info(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        results = checker.scan_project()
+    def test_scan_ai_files_have_framework_info(self, scanned_ai_project):
+        _, results = scanned_ai_project
         for ai_file in results["ai_files"]:
             assert "file" in ai_file
             assert "frameworks" in ai_file
@@ -164,9 +167,8 @@ class TestScanProject:
 class TestCheckCompliance:
     """Tests for check_compliance: returns structured JSON with risk info."""
 
-    def test_limited_risk_returns_valid_structure(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        checker.scan_project()
+    def test_limited_risk_returns_valid_structure(self, scanned_ai_project):
+        checker, _ = scanned_ai_project
         result = checker.check_compliance("limited")
         assert result["risk_category"] == "limited"
         assert "compliance_status" in result
@@ -196,9 +198,8 @@ class TestCheckCompliance:
         assert "basic_documentation" in result["compliance_status"]
         assert result["compliance_status"]["basic_documentation"] is True
 
-    def test_compliance_score_format(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        checker.scan_project()
+    def test_compliance_score_format(self, scanned_ai_project):
+        checker, _ = scanned_ai_project
         result = checker.check_compliance("limited")
         # Score format is "N/M"
         score = result["compliance_score"]
@@ -207,9 +208,8 @@ class TestCheckCompliance:
         assert int(parts[0]) >= 0
         assert int(parts[1]) > 0
 
-    def test_compliance_percentage_is_number(self, ai_project):
-        checker = EUAIActChecker(str(ai_project))
-        checker.scan_project()
+    def test_compliance_percentage_is_number(self, scanned_ai_project):
+        checker, _ = scanned_ai_project
         result = checker.check_compliance("limited")
         pct = result["compliance_percentage"]
         assert isinstance(pct, (int, float))
@@ -293,7 +293,7 @@ class TestRegulationInfo:
     def test_all_risk_categories_have_requirements(self):
         for cat, info in RISK_CATEGORIES.items():
             assert "requirements" in info
-            assert isinstance(info["requirements"], list)
+            assert isinstance(info["requirements"], (list, tuple))
             assert len(info["requirements"]) > 0, f"No requirements for {cat}"
 
     def test_four_risk_categories_exist(self):
@@ -13,7 +13,6 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "api_wrapper"))
 
 from server import (
@@ -399,6 +398,87 @@ def stripe_client(tmp_path):
     main_mod._DATA_DIR = orig_data_dir
 
 
+class TestWrapperRateLimit:
+
+    def test_scan_429_after_free_tier(self, stripe_client, monkeypatch):
+        """File-backed counter rejects the 11th keyless scan from one IP."""
+        import api_wrapper.main as main_mod
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        with patch.object(main_mod, "_redis", None), patch.dict(main_mod._BLOCKED, clear=True):
+            for _ in range(main_mod._FREE_TIER_LIMIT):
+                assert main_mod._check_rate_limit("203.0.113.9")[0] is True
+            resp = stripe_client.post("/scan", json={"text": "import openai"},
+                                      headers={"X-Forwarded-For": "203.0.113.9"})
+        assert resp.status_code == 429
+        assert resp.json()["detail"]["resets_in_seconds"] > 0
+
+    def test_blocked_ip_rejected_without_io(self, stripe_client):
+        """Once over the limit, the IP is rejected from memory until midnight."""
+        import api_wrapper.main as main_mod
+        with patch.object(main_mod, "_redis", False), \
+             patch.dict(main_mod._BLOCKED, {"203.0.113.10": time.time() + 60}, clear=True), \
+             patch.object(main_mod, "_load_json") as load:
+            assert main_mod._check_rate_limit("203.0.113.10") == (False, 0)
+        load.assert_not_called()
+
+    def test_redis_counter_blocks_over_limit(self, stripe_client):
+        """With a Redis client the counter is INCR'd in a pipeline; over the limit blocks the IP."""
+        import api_wrapper.main as main_mod
+
+        class _Pipeline:
+            def __init__(self, store):
+                self.store, self.ops = store, []
+
+            def incr(self, key):
+                self.ops.append(key)
+
+            def expire(self, key, seconds):
+                assert seconds > 0
+
+            def execute(self):
+                results = []
+                for key in self.ops:
+                    self.store[key] = self.store.get(key, 0) + 1
+                    results.append(self.store[key])
+                return results + [True]
+
+        class _StubRedis:
+            def __init__(self):
+                self.store = {}
+
+            def pipeline(self):
+                return _Pipeline(self.store)
+
+        stub = _StubRedis()
+        ip = "203.0.113.11"
+        with patch.object(main_mod, "_redis", stub), \
+             patch.dict(main_mod._BLOCKED, clear=True), \
+             patch.object(main_mod, "_load_json") as load:
+            assert main_mod._check_rate_limit(ip) == (True, main_mod._FREE_TIER_LIMIT - 1)
+            for _ in range(main_mod._FREE_TIER_LIMIT - 1):
+                assert main_mod._check_rate_limit(ip)[0] is True
+            assert main_mod._check_rate_limit(ip) == (False, 0)
+            assert ip in main_mod._BLOCKED
+        load.assert_not_called()
+        assert list(stub.store.values()) == [main_mod._FREE_TIER_LIMIT + 1]
+
+    def test_scan_etag_revalidation_skips_rate_limit(self, stripe_client):
+        """Matching If-None-Match returns 304 without consuming quota."""
+        import api_wrapper.main as main_mod
+        body = {"text": "import openai"}
+        first = stripe_client.post("/scan", json=body)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        with patch.object(main_mod, "_check_rate_limit") as rate_limit:
+            resp = stripe_client.post("/scan", json=body, headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+        rate_limit.assert_not_called()
+        other = stripe_client.post("/scan", json={"text": "import torch"}, headers={"If-None-Match": etag})
+        assert other.status_code == 200
+        assert other.headers["ETag"] != etag
+
+
 class TestStripeCheckout:
 
     def test_checkout_no_stripe_key(self, stripe_client):
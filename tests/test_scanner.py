@@ -1,122 +1,204 @@
 """Scanner accuracy tests — framework detection, false positives."""
 
 import os
-import tempfile
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
+import server
 from server import EUAIActChecker
+from tests.helpers import write_project
 
 
-def _make_project(files: dict) -> str:
-    """Create a temp project with given files. Returns path."""
-    d = tempfile.mkdtemp()
-    for name, content in files.items():
-        path = Path(d) / name
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
-    return d
+# Fixture contents shared by several tests, encoded once at import.
+_OPENAI_PY = b"import openai\nclient = openai.ChatCompletion.create()"
+_HELLO_PY = b"print('hello')"
+_AI_CORE_PY = b"from anthropic import Anthropic\n"
+_HANDLER_PY = b"from ai_core import process\n"
 
 
 class TestFrameworkDetection:
     """Verify AI framework detection accuracy."""
 
-    def test_detect_openai(self):
-        proj = _make_project({"app.py": "import openai\nclient = openai.ChatCompletion.create()"})
+    def test_detect_openai(self, make_project):
+        proj = make_project({"app.py": _OPENAI_PY})
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert "openai" in result["detected_models"]
 
-    def test_detect_anthropic(self):
-        proj = _make_project({"chat.py": "from anthropic import Anthropic\nclient = Anthropic()"})
+    def test_detect_anthropic(self, make_project):
+        proj = make_project({"chat.py": b"from anthropic import Anthropic\nclient = Anthropic()"})
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert "anthropic" in result["detected_models"]
 
-    def test_detect_langchain(self):
-        proj = _make_project({"chain.py": "from langchain import LLMChain\nfrom langchain.agents import initialize_agent"})
+    def test_detect_langchain(self, make_project):
+        proj = make_project({"chain.py": b"from langchain import LLMChain\nfrom langchain.agents import initialize_agent"})
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert "langchain" in result["detected_models"]
 
-    def test_detect_huggingface(self):
-        proj = _make_project({"model.py": "from transformers import AutoModel"})
+    def test_detect_huggingface(self, make_project):
+        proj = make_project({"model.py": b"from transformers import AutoModel"})
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert "huggingface" in result["detected_models"]
 
-    def test_detect_tensorflow(self):
-        proj = _make_project({"train.py": "import tensorflow as tf"})
+    def test_detect_tensorflow(self, make_project):
+        proj = make_project({"train.py": b"import tensorflow as tf"})
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert "tensorflow" in result["detected_models"]
 
-    def test_detect_pytorch(self):
-        proj = _make_project({"train.py": "import torch\nmodel = torch.nn.Linear(10, 5)"})
+    def test_detect_pytorch(self, make_project):
+        proj = make_project({"train.py": b"import torch\nmodel = torch.nn.Linear(10, 5)"})
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert "pytorch" in result["detected_models"]
 
-    def test_detect_in_requirements(self):
-        proj = _make_project({"requirements.txt": "openai>=1.0.0\nfastapi"})
+    def test_detect_in_requirements(self, make_project):
+        proj = make_project({"requirements.txt": b"openai>=1.0.0\nfastapi"})
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert "openai" in result["detected_models"]
 
-    def test_no_false_positive_on_clean_project(self):
-        proj = _make_project({
-            "app.py": "from flask import Flask\napp = Flask(__name__)",
-            "requirements.txt": "flask\nrequests\npydantic",
+    def test_no_false_positive_on_clean_project(self, make_project):
+        proj = make_project({
+            "app.py": b"from flask import Flask\napp = Flask(__name__)",
+            "requirements.txt": b"flask\nrequests\npydantic",
         })
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert result["detected_models"] == {}
 
-    def test_empty_project(self):
-        proj = _make_project({})
+    def test_empty_project(self, make_project):
+        proj = make_project({})
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert result["files_scanned"] == 0
         assert result["detected_models"] == {}
 
-    def test_files_scanned_count(self):
-        proj = _make_project({
-            "a.py": "print('hello')",
-            "b.py": "print('world')",
-            "c.txt": "not python",
+    def test_files_scanned_count(self, make_project):
+        proj = make_project({
+            "a.py": _HELLO_PY,
+            "b.py": b"print('world')",
+            "c.txt": b"not python",
         })
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert result["files_scanned"] >= 2
 
-    def test_skip_venv_directory(self):
-        proj = _make_project({
-            "app.py": "print('clean')",
-            ".venv/lib/openai.py": "import openai",
+    def test_ai_files_sorted_by_path(self, make_project):
+        proj = make_project({name: _OPENAI_PY for name in ("zeta.py", "alpha.py", "pkg/mid.py")})
+        result = EUAIActChecker(proj).scan_project()
+        files = [entry["file"] for entry in result["ai_files"]]
+        assert files == sorted(files) and len(files) == 3
+
+    def test_second_scan_on_same_checker(self, make_project):
+        proj = make_project({"a.py": _OPENAI_PY})
+        checker = EUAIActChecker(proj)
+        first = checker.scan_project()
+        Path(proj, "b.py").write_bytes(_AI_CORE_PY)
+        second = checker.scan_project(follow_imports=True)
+        assert first["detected_models"] == {"openai": ["a.py"]}
+        assert second["detected_models"] == {"openai": ["a.py"], "anthropic": ["b.py"]}
+        assert second["files_scanned"] == 2
+        assert [entry["file"] for entry in second["ai_files"]] == ["a.py", "b.py"]
+
+    @pytest.mark.parametrize("batch", [4, 64])
+    def test_many_files_read_on_thread_pool(self, make_project, batch, monkeypatch):
+        monkeypatch.setattr(server, "_SCAN_READ_BATCH", batch)
+        files = {f"mod{i}.py": _HELLO_PY for i in range(20)}
+        files["mod7.py"] = b"import openai"
+        files["requirements.txt"] = b"anthropic>=0.30"
+        proj = make_project(files)
+        checker = EUAIActChecker(proj)
+        result = checker.scan_project()
+        assert result["files_scanned"] == 21
+        assert result["detected_models"]["openai"] == ["mod7.py"]
+        assert result["detected_models"]["anthropic"] == ["requirements.txt"]
+
+    def test_skip_venv_directory(self, make_project):
+        proj = make_project({
+            "app.py": b"print('clean')",
+            ".venv/lib/openai.py": b"import openai",
         })
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
         assert "openai" not in result["detected_models"]
 
+    def test_skip_dirs_only_apply_below_project_root(self, make_project):
+        parent = make_project({"build/proj/app.py": b"import openai"})
+        checker = EUAIActChecker(str(Path(parent) / "build" / "proj"))
+        result = checker.scan_project()
+        assert "openai" in result["detected_models"]
+        assert result["files_scanned"] == 1
+
+
+class TestLiteralAutomaton:
+    """The optional Aho-Corasick prefilter must agree with the substring loop."""
+
+    def test_same_detections_as_substring_prefilter(self):
+        pytest.importorskip("ahocorasick")
+        automaton = server._build_literal_automaton(server._CONFIG_PATTERN_LITERALS)
+        for content in ("openai>=1.0\nfastapi", "langchain-openai\ntorch==2.1", "flask\nrequests"):
+            args = (content, server._CONFIG_PATTERNS_COMPILED, server._CONFIG_PATTERN_LITERALS)
+            assert server._detect_frameworks(*args, literal_ac=automaton) == server._detect_frameworks(*args)
+
+
+class TestFusedPattern:
+    """A fused named-group pass must not change detections, even when its matches overlap."""
+
+    def test_same_detections_as_per_pattern_search(self):
+        # Built with stdlib re: the fused pass is normally only used under re2.
+        fused = re.compile(server._fused_scan_source(server.AI_MODEL_PATTERNS))
+        for content in (
+            "import openai\nfrom anthropic import Anthropic",
+            "from langchain_openai import ChatOpenAI\nfrom openai import AzureOpenAI",
+            "from flask import Flask",
+        ):
+            args = (content, server._AI_PATTERNS_COMPILED, server._AI_PATTERN_LITERALS)
+            assert server._detect_frameworks(*args, fused=fused) == server._detect_frameworks(*args)
+
+
+@pytest.mark.skipif(shutil.which("rg") is None, reason="ripgrep not installed")
+class TestRipgrepPrefilter:
+    """The rg prefilter must not change scan results."""
+
+    def test_same_result_as_python_scan(self, make_project, monkeypatch):
+        files = {f"pkg/mod{i}.py": _HELLO_PY for i in range(10)}
+        files["pkg/mod3.py"] = b"from anthropic import Anthropic"
+        files["requirements.txt"] = b"openai>=1.0"
+        files["node_modules/x.js"] = b"import openai"
+        proj = make_project(files)
+
+        monkeypatch.setattr(server, "_RG_PATH", None)
+        expected = EUAIActChecker(proj).scan_project()
+        monkeypatch.setattr(server, "_RG_PATH", shutil.which("rg"))
+        monkeypatch.setattr(server, "_RG_MIN_CANDIDATES", 0)
+        assert server._rg_files_with_literals(Path(proj), [(Path(proj), True)]) is not None
+        assert EUAIActChecker(proj).scan_project() == expected
+
 
 class TestFollowImports:
     """Verify follow_imports propagation through Python import graph."""
 
-    def test_direct_import_no_propagation_needed(self):
+    def test_direct_import_no_propagation_needed(self, make_project):
         """When AI import is direct, follow_imports adds no extra files."""
-        proj = _make_project({"app.py": "import openai\nclient = openai.ChatCompletion.create()"})
+        proj = make_project({"app.py": _OPENAI_PY})
         checker = EUAIActChecker(proj)
         result = checker.scan_project(follow_imports=True)
         assert result.get("follow_imports_applied") is True
         assert result["propagated_files"] == []
 
-    def test_transitive_import_detected(self):
+    def test_transitive_import_detected(self, make_project):
         """File importing from AI-flagged file should appear in propagated_files."""
-        proj = _make_project({
-            "core/ai_engine.py": "from openai import OpenAI\nclient = OpenAI()",
-            "routes/analyze.py": "from core.ai_engine import run_analysis\n",
+        proj = make_project({
+            "core/ai_engine.py": b"from openai import OpenAI\nclient = OpenAI()",
+            "routes/analyze.py": b"from core.ai_engine import run_analysis\n",
         })
         checker = EUAIActChecker(proj)
         result = checker.scan_project(follow_imports=True)
@@ -126,11 +208,22 @@ class TestFollowImports:
             f"routes/analyze.py should be propagated, got: {propagated_files}"
         )
 
-    def test_propagated_file_in_detected_models(self):
+    def test_multi_hop_chain_records_nearest_source(self, make_project):
+        proj = make_project({
+            "a.py": b"import openai\n",
+            "b.py": b"import a\n",
+            "c.py": b"import b\n",
+            "d.py": b"import c\nimport a\n",
+        })
+        result = EUAIActChecker(proj).scan_project(follow_imports=True)
+        entries = {p["file"]: p["imports_from"] for p in result["propagated_files"]}
+        assert entries == {"b.py": "a.py", "d.py": "a.py", "c.py": "b.py"}
+
+    def test_propagated_file_in_detected_models(self, make_project):
         """Propagated files appear in detected_models so compliance checks cover them."""
-        proj = _make_project({
-            "ai_core.py": "from anthropic import Anthropic\n",
-            "handler.py": "from ai_core import process\n",
+        proj = make_project({
+            "ai_core.py": _AI_CORE_PY,
+            "handler.py": _HANDLER_PY,
         })
         checker = EUAIActChecker(proj)
         result = checker.scan_project(follow_imports=True)
@@ -139,22 +232,129 @@ class TestFollowImports:
             f"handler.py should be in detected_models['anthropic'], got: {anthropic_files}"
         )
 
-    def test_non_ai_project_no_propagation(self):
+    def test_non_ai_project_no_propagation(self, make_project):
         """No propagation when no AI frameworks are detected."""
-        proj = _make_project({
-            "utils.py": "import math\n",
-            "app.py": "from utils import compute\n",
+        proj = make_project({
+            "utils.py": b"import math\n",
+            "app.py": b"from utils import compute\n",
         })
         checker = EUAIActChecker(proj)
         result = checker.scan_project(follow_imports=True)
         assert result.get("follow_imports_applied") is True
         assert result["propagated_files"] == []
 
-    def test_follow_imports_false_by_default(self):
+    def test_skip_dirs_pruned_not_walked(self, make_project, monkeypatch):
+        """SKIP_DIRS subtrees are never listed, by the scan or the import-graph walk."""
+        proj = make_project({
+            "app.py": b"import openai\n",
+            "handler.py": b"from app import client\n",
+            ".venv/lib/site.py": b"import anthropic\n",
+            "node_modules/pkg/index.js": b"import openai\n",
+        })
+        listed = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            listed.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(server.os, "scandir", recording_scandir)
+        result = EUAIActChecker(proj).scan_project(follow_imports=True)
+        assert [p["file"] for p in result["propagated_files"]] == ["handler.py"]
+        assert listed and not any(".venv" in p or "node_modules" in p for p in listed)
+
+    def test_files_not_naming_project_modules_are_not_parsed(self, make_project, monkeypatch):
+        proj = make_project({
+            "ai_core.py": _AI_CORE_PY,
+            "handler.py": _HANDLER_PY,
+            "util.py": b"import math\n",
+        })
+        parsed = []
+        real_parse = server.ast.parse
+
+        def recording_parse(source, filename="<unknown>", *args, **kwargs):
+            parsed.append(os.path.basename(filename))
+            return real_parse(source, filename, *args, **kwargs)
+
+        monkeypatch.setattr(server.ast, "parse", recording_parse)
+        result = EUAIActChecker(proj).scan_project(follow_imports=True)
+        assert [p["file"] for p in result["propagated_files"]] == ["handler.py"]
+        assert "util.py" not in parsed
+
+    def test_unchanged_files_not_reparsed(self, make_project, monkeypatch):
+        proj = make_project({
+            "ai_core.py": _AI_CORE_PY,
+            "handler.py": _HANDLER_PY,
+        })
+        EUAIActChecker(proj).scan_project(follow_imports=True)
+        parsed = []
+        real_parse = server.ast.parse
+
+        def recording_parse(source, filename="<unknown>", *args, **kwargs):
+            parsed.append(os.path.basename(filename))
+            return real_parse(source, filename, *args, **kwargs)
+
+        monkeypatch.setattr(server.ast, "parse", recording_parse)
+        result = EUAIActChecker(proj).scan_project(follow_imports=True)
+        assert [p["file"] for p in result["propagated_files"]] == ["handler.py"]
+        assert parsed == []
+
+    def test_import_cache_eviction_from_many_threads(self, monkeypatch):
+        monkeypatch.setattr(server, "_PY_IMPORTS_CACHE", {})
+        monkeypatch.setattr(server, "_PY_IMPORTS_CACHE_MAX", 8)
+        mentions = re.compile("ai_core")
+
+        def parse(i):
+            key = (f"m{i}.py", i, 0)
+            return server._python_file_imports(Path(key[0]), key, "import ai_core\n", mentions)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert set(pool.map(parse, range(2000))) == {("ai_core",)}
+        assert len(server._PY_IMPORTS_CACHE) <= 8
+
+    def test_import_graph_reuses_sources_read_by_scan(self, make_project, monkeypatch):
+        proj = make_project({
+            "ai_core.py": _AI_CORE_PY,
+            "handler.py": _HANDLER_PY,
+            "util.py": b"import math\n",
+        })
+        reread = []
+        monkeypatch.setattr(Path, "read_bytes", lambda self: reread.append(self.name))
+        result = EUAIActChecker(proj).scan_project(follow_imports=True)
+        assert [p["file"] for p in result["propagated_files"]] == ["handler.py"]
+        assert reread == []
+
+    def test_oversize_module_links_imports_past_size_limit(self, make_project, monkeypatch):
+        body = b"".join(b"def f%d():\n    return %d\n" % (i, i) for i in range(200))
+        proj = make_project({
+            "ai_core.py": _AI_CORE_PY,
+            "bridge.py": body + b"from ai_core import process\n",
+            "handler.py": b"from bridge import f1\n",
+        })
+        monkeypatch.setattr(server, "MAX_FILE_SIZE_BYTES", 1024)
+        result = EUAIActChecker(proj).scan_project(follow_imports=True)
+        assert sorted(p["file"] for p in result["propagated_files"]) == ["bridge.py", "handler.py"]
+
+    def test_import_collector_finds_nested_statement_imports(self):
+        source = (
+            "import a\n"
+            "try:\n    from b.c import d\nexcept ImportError:\n    import e\n"
+            "def f():\n    with open('x'):\n        import g\n"
+            "from . import relative\n"
+        )
+        assert server._parse_python_imports(source, "m.py") == ("a", "b.c", "e", "g")
+
+    def test_nested_imports_flag_read_at_visit_time(self, monkeypatch):
+        source = "import a\ndef f():\n    import b\nclass C:\n    import c\n"
+        assert server._parse_python_imports(source, "m.py") == ("a", "b", "c")
+        monkeypatch.setattr(server, "_FOLLOW_NESTED_IMPORTS", False)
+        assert server._parse_python_imports(source, "m.py") == ("a",)
+
+    def test_follow_imports_false_by_default(self, make_project):
         """follow_imports is False by default — no propagated_files key."""
-        proj = _make_project({
-            "core/ai_engine.py": "from openai import OpenAI\n",
-            "routes/analyze.py": "from core.ai_engine import run_analysis\n",
+        proj = make_project({
+            "core/ai_engine.py": b"from openai import OpenAI\n",
+            "routes/analyze.py": b"from core.ai_engine import run_analysis\n",
         })
         checker = EUAIActChecker(proj)
         result = checker.scan_project()
@@ -162,26 +362,92 @@ class TestFollowImports:
         assert "propagated_files" not in result
 
 
+class TestCheckerCache:
+    """Repeat tool calls on an unchanged project reuse one scan."""
+
+    def test_unchanged_project_reuses_checker(self, make_project):
+        proj = make_project({"app.py": _OPENAI_PY})
+        first, results = server._get_checker(proj)
+        second, again = server._get_checker(proj)
+        assert second is first
+        assert again == results and again is not results
+
+    def test_mutating_results_does_not_touch_cache(self, make_project):
+        proj = make_project({"app.py": _OPENAI_PY})
+        _, results = server._get_checker(proj)
+        results["ai_files"].clear()
+        results["detected_models"]["openai"].append("injected.py")
+        _, again = server._get_checker(proj)
+        assert again["ai_files"]
+        assert "injected.py" not in again["detected_models"]["openai"]
+
+    def test_edited_file_invalidates(self, make_project):
+        proj = make_project({"app.py": _HELLO_PY})
+        first, results = server._get_checker(proj)
+        assert results["detected_models"] == {}
+        Path(proj, "app.py").write_bytes(b"import anthropic\n")
+        second, results = server._get_checker(proj)
+        assert second is not first
+        assert "anthropic" in results["detected_models"]
+
+    def test_legacy_server_scans_once_per_conversation(self, make_project, monkeypatch):
+        proj = make_project({"app.py": _OPENAI_PY})
+        scans = []
+        real_scan = EUAIActChecker.scan_project
+        monkeypatch.setattr(EUAIActChecker, "scan_project",
+                            lambda self, **kw: scans.append(1) or real_scan(self, **kw))
+        mcp = server.MCPServer()
+        for tool in ("scan_project", "check_compliance", "generate_report"):
+            assert "results" in mcp.handle_request(tool, {"project_path": proj})
+        assert len(scans) == 1
+
+
+@pytest.fixture(scope="module")
+def openai_checker(tmp_path_factory):
+    """One scanned ``import openai`` project shared by the compliance tests."""
+    checker = EUAIActChecker(str(write_project(tmp_path_factory.mktemp("openai"), {"app.py": b"import openai"})))
+    checker.scan_project()
+    return checker
+
+
 class TestCompliance:
     """Verify compliance check logic."""
 
-    def test_compliance_high_risk(self):
-        proj = _make_project({"app.py": "import openai"})
-        checker = EUAIActChecker(proj)
-        checker.scan_project()
-        result = checker.check_compliance("high")
+    def test_compliance_high_risk(self, openai_checker):
+        result = openai_checker.check_compliance("high")
         assert "requirements" in result
         assert len(result["requirements"]) > 0
 
-    def test_compliance_minimal_risk(self):
-        proj = _make_project({"app.py": "import openai"})
+    def test_compliance_minimal_risk(self, openai_checker):
+        result = openai_checker.check_compliance("minimal")
+        assert "requirements" in result
+
+    def test_python_file_list_cached_until_refresh(self, make_project, monkeypatch):
+        proj = make_project({"app.py": b"# generated by AI\n"})
         checker = EUAIActChecker(proj)
         checker.scan_project()
-        result = checker.check_compliance("minimal")
-        assert "requirements" in result
+        monkeypatch.setattr(server, "_iter_project_files", lambda root: iter(()))
+        assert checker._check_content_marking() is True
+        checker.refresh()
+        assert checker._check_content_marking() is False
+
+    def test_doc_listing_sees_documents_added_later(self, make_project):
+        proj = make_project({"app.py": _HELLO_PY})
+        checker = EUAIActChecker(proj)
+        assert checker._check_file_exists("RISK_MANAGEMENT.md") is False
+        Path(proj, "docs").mkdir()
+        Path(proj, "docs", "RISK_MANAGEMENT.md").write_bytes(b"# Risks\n")
+        assert checker._check_file_exists("RISK_MANAGEMENT.md") is True
+
+    def test_doc_names_casefolded_on_case_insensitive_fs(self, make_project, monkeypatch):
+        monkeypatch.setattr(server, "_FS_CASE_INSENSITIVE", True)
+        proj = make_project({"readme.md": b"# Docs\n"})
+        checker = EUAIActChecker(proj)
+        assert checker._check_file_exists("README.md") is True
+        assert checker._check_technical_docs() is True
 
-    def test_compliance_no_ai_detected(self):
-        proj = _make_project({"app.py": "print('hello')"})
+    def test_compliance_no_ai_detected(self, make_project):
+        proj = make_project({"app.py": _HELLO_PY})
         checker = EUAIActChecker(proj)
         checker.scan_project()
         result = checker.check_compliance("limited")
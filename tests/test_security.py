@@ -2,10 +2,6 @@
 
 import os
 import tempfile
-from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from server import _validate_project_path, BLOCKED_PATHS
 